@@ -0,0 +1,403 @@
+"""Benchmarks for the generation and analysis hot paths.
+
+Runs without Streamlit (only the ``seo_studio`` package is imported) and writes
+JSON that can be compared between commits::
+
+    python benchmarks/run.py -o before.json
+    python benchmarks/run.py -o after.json --compare before.json
+    python benchmarks/run.py --quick --only density,wordcloud
+
+Document-size cases run at 1k, 10k and 100k words (``--quick``: 1k and 10k);
+batch cases at 10, 100 and 1000 keywords; clustering at 1k, 10k and 100k.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SEO_OFFLINE", "1")
+
+from seo_studio.analysis import text_metrics  # noqa: E402
+from seo_studio.batch import iter_results  # noqa: E402
+from seo_studio.charts import density_figure, keyword_weights, radar_figure, wordcloud_png  # noqa: E402
+from seo_studio.clustering import build_content_plan  # noqa: E402
+from seo_studio.content import generate_content  # noqa: E402
+from seo_studio.density import DensityEngine  # noqa: E402
+from seo_studio.export import to_docx, to_html  # noqa: E402
+from seo_studio.incremental import IncrementalAnalyzer  # noqa: E402
+from seo_studio.keyword_graph import KeywordGraph, build_graph  # noqa: E402
+from seo_studio.keywords import KEYWORD_DATABASE, _mock_keyword_data, get_keyword_data  # noqa: E402
+from seo_studio.providers import KeywordClient, LocalProvider  # noqa: E402
+from seo_studio.render_cache import RenderCache  # noqa: E402
+from seo_studio.scoring import rank, score_drafts  # noqa: E402
+from seo_studio.templates import title_templates  # noqa: E402
+from seo_studio.readability import default_table, score_documents  # noqa: E402
+from seo_studio.textscan import scan_text  # noqa: E402
+
+DOC_SIZES = (1000, 10000, 100000)
+QUICK_DOC_SIZES = (1000, 10000)
+BATCH_SIZES = (10, 100, 1000)
+QUICK_BATCH_SIZES = (10, 100)
+CLUSTER_SIZES = (1000, 10000, 100000)
+QUICK_CLUSTER_SIZES = (1000, 10000)
+
+SEED_KEYWORDS = list(KEYWORD_DATABASE) + [
+    "content strategy", "local seo", "email automation", "vegan meal prep", "home workouts",
+    "budget travel", "remote work tools", "personal finance", "web accessibility", "cloud security",
+]
+
+BENCHMARKS = []
+# Callbacks registered during a case's setup; the runner calls them once the case is measured
+CLEANUPS = []
+
+
+def benchmark(name, params=None, quick_params=None, unit=None):
+    """Register ``setup(param)``, which returns the zero-argument callable to time."""
+    def register(setup):
+        BENCHMARKS.append({"name": name, "setup": setup, "params": params or (None,),
+                           "quick_params": quick_params or params or (None,), "unit": unit})
+        return setup
+    return register
+
+
+def temp_dir(prefix):
+    """Return a temporary directory that is deleted after the current case."""
+    tmp = tempfile.TemporaryDirectory(prefix=prefix)
+    CLEANUPS.append(tmp.cleanup)
+    return tmp.name
+
+
+def make_keywords(count):
+    return [f"{SEED_KEYWORDS[i % len(SEED_KEYWORDS)]} {i}" if i >= len(SEED_KEYWORDS) else SEED_KEYWORDS[i]
+            for i in range(count)]
+
+
+_documents = {}
+
+
+def make_document(words):
+    """Return a generated draft of at least ``words`` words (deterministic)."""
+    if words not in _documents:
+        rng = random.Random(words)
+        parts, total, i = [], 0, 0
+        while total < words:
+            keyword = SEED_KEYWORDS[i % len(SEED_KEYWORDS)]
+            post = generate_content(keyword, title_templates(keyword)[0], rng=rng)
+            parts.append(post)
+            total += len(post.split())
+            i += 1
+        _documents[words] = "\n".join(parts)
+    return _documents[words]
+
+
+# ---------------- KEYWORDS ----------------
+@benchmark("keyword_lookup", BATCH_SIZES, QUICK_BATCH_SIZES, unit="keywords")
+def bench_keyword_lookup(size):
+    keywords = make_keywords(size)
+
+    def run():
+        _mock_keyword_data.cache_clear()
+        for kw in keywords:
+            get_keyword_data(kw)
+    return run
+
+
+@benchmark("provider_lookup", BATCH_SIZES, QUICK_BATCH_SIZES, unit="keywords")
+def bench_provider_lookup(size):
+    keywords = make_keywords(size)
+
+    def run():
+        _mock_keyword_data.cache_clear()
+        client = KeywordClient(LocalProvider())
+        client.lookup_many(keywords)
+        client.close()
+    return run
+
+
+@benchmark("graph_neighbors", unit="lookups")
+def bench_graph_neighbors(_):
+    graph_dir = temp_dir("seo-graph-")
+    build_graph(make_keywords(5000), graph_dir)
+    graph = KeywordGraph(graph_dir)
+    keywords = make_keywords(100)
+    state = {"i": 0}
+
+    def run():
+        state["i"] = (state["i"] + 1) % len(keywords)
+        graph.neighbors(keywords[state["i"]])
+    return run
+
+
+@benchmark("graph_expand", unit="expansions")
+def bench_graph_expand(_):
+    graph_dir = temp_dir("seo-graph-")
+    build_graph(make_keywords(5000), graph_dir)
+    graph = KeywordGraph(graph_dir)
+    return lambda: graph.expand("digital marketing 42", depth=2)
+
+
+@benchmark("keyword_clustering", CLUSTER_SIZES, QUICK_CLUSTER_SIZES, unit="keywords")
+def bench_keyword_clustering(size):
+    keywords = make_keywords(size)
+    return lambda: build_content_plan(keywords)
+
+
+# ---------------- GENERATION ----------------
+@benchmark("generate_content", unit="posts")
+def bench_generate_content(_):
+    rng = random.Random(0)
+    title = title_templates("digital marketing")[0]
+    return lambda: generate_content("digital marketing", title, rng=rng)
+
+
+@benchmark("batch_pipeline", BATCH_SIZES, QUICK_BATCH_SIZES, unit="keywords")
+def bench_batch_pipeline(size):
+    keywords = make_keywords(size)
+
+    def run():
+        for _ in iter_results(keywords, workers=1, include_content=False, seed=0):
+            pass
+    return run
+
+
+# ---------------- ANALYSIS ----------------
+@benchmark("readability", DOC_SIZES, QUICK_DOC_SIZES, unit="words")
+def bench_readability(words):
+    text = make_document(words)
+
+    def run():
+        default_table.cache_clear()
+        text_metrics(scan_text(text))
+    return run
+
+
+@benchmark("readability_bulk", BATCH_SIZES, QUICK_BATCH_SIZES, unit="documents")
+def bench_readability_bulk(size):
+    texts = [generate_content(kw, kw.title(), rng=random.Random(i)) for i, kw in enumerate(make_keywords(size))]
+
+    def run():
+        default_table.cache_clear()
+        score_documents(texts, target=70)
+    return run
+
+
+@benchmark("seo_scoring", BATCH_SIZES, QUICK_BATCH_SIZES, unit="drafts")
+def bench_seo_scoring(size):
+    keyword = "digital marketing"
+    texts = [generate_content(keyword, keyword.title(), rng=random.Random(i)) for i in range(size)]
+    related = KEYWORD_DATABASE[keyword]["related"]
+    return lambda: rank(score_drafts(texts, keyword, related))
+
+
+@benchmark("incremental_edit", DOC_SIZES, QUICK_DOC_SIZES, unit="words")
+def bench_incremental_edit(words):
+    text = make_document(words)
+    related = KEYWORD_DATABASE["digital marketing"]["related"]
+    analyzer = IncrementalAnalyzer()
+    analyzer.update(text)
+    edits = [text + f"\n\nOne more closing paragraph, version {i}." for i in range(2)]
+    state = {"i": 0}
+
+    def run():
+        state["i"] ^= 1
+        analyzer.update(edits[state["i"]])
+        analyzer.density("digital marketing", related)
+    return run
+
+
+@benchmark("density", DOC_SIZES, QUICK_DOC_SIZES, unit="words")
+def bench_density(words):
+    text = make_document(words)
+    related = KEYWORD_DATABASE["digital marketing"]["related"]
+
+    def run():
+        DensityEngine().analyze(text, "digital marketing", related)
+    return run
+
+
+# ---------------- RENDERING ----------------
+@benchmark("wordcloud", DOC_SIZES, QUICK_DOC_SIZES, unit="words")
+def bench_wordcloud(words):
+    text = make_document(words)
+    return lambda: wordcloud_png(text, cache=RenderCache())
+
+
+@benchmark("keyword_cloud", (1, 2), (1,), unit="clouds")
+def bench_keyword_cloud(scale):
+    weights = keyword_weights("digital marketing", KEYWORD_DATABASE["digital marketing"]["related"])
+    return lambda: wordcloud_png(weights, scale=scale, cache=RenderCache())
+
+
+@benchmark("radar_chart")
+def bench_radar_chart(_):
+    return lambda: radar_figure("digital marketing", [29.6, 72, 62.25, 55, 60], cache=RenderCache()).to_json()
+
+
+@benchmark("density_chart")
+def bench_density_chart(_):
+    rows = DensityEngine().analyze(make_document(1000))["top_phrases"]
+    return lambda: density_figure(rows, cache=RenderCache()).to_json()
+
+
+@benchmark("export_docx", DOC_SIZES, QUICK_DOC_SIZES, unit="words")
+def bench_export_docx(words):
+    text = make_document(words)
+    return lambda: to_docx(text)
+
+
+@benchmark("export_html", DOC_SIZES, QUICK_DOC_SIZES, unit="words")
+def bench_export_html(words):
+    text = make_document(words)
+    return lambda: to_html(text)
+
+
+@benchmark("package_import")
+def bench_package_import(_):
+    code = "import seo_studio, sys; assert 'streamlit' not in sys.modules"
+    return lambda: subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+
+# ---------------- RUNNER ----------------
+def measure(func, repeats, min_time):
+    """Return per-call timings: ``repeats`` rounds, each looping until ``min_time`` seconds."""
+    func()  # warm up imports and lazily built state
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+    samples = [elapsed / loops]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "loops": loops,
+        "repeats": repeats,
+    }
+
+
+def case_name(bench, param):
+    return bench["name"] if param is None else f"{bench['name']}[{param}]"
+
+
+def run_benchmarks(patterns=None, quick=False, repeats=5, min_time=0.2):
+    """Run the selected benchmarks; return ``{case name: result}``."""
+    results = {}
+    for bench in BENCHMARKS:
+        for param in bench["quick_params"] if quick else bench["params"]:
+            name = case_name(bench, param)
+            if patterns and not any(fnmatch.fnmatch(name, p) or bench["name"] == p for p in patterns):
+                continue
+            try:
+                result = measure(bench["setup"](param), repeats, min_time)
+            finally:
+                while CLEANUPS:
+                    CLEANUPS.pop()()
+            if bench["unit"] and param is not None:
+                result["throughput"] = param / result["median"]
+                result["unit"] = f"{bench['unit']}/s"
+            elif bench["unit"]:
+                result["throughput"] = 1 / result["median"]
+                result["unit"] = f"{bench['unit']}/s"
+            results[name] = result
+            print(f"{name:<28} {result['median'] * 1000:>10.3f} ms  (±{result['stdev'] * 1000:.3f}, "
+                  f"{result['loops']} loops x {repeats})", file=sys.stderr)
+    return results
+
+
+def metadata():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print median ratios against ``baseline``; return the names that regressed."""
+    regressions = []
+    print(f"\n{'case':<28} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            print(f"{name:<28} {'-':>12} {result['median'] * 1000:>10.3f}ms {'new':>8}")
+            continue
+        ratio = result["median"] / old["median"] if old["median"] else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            flag = "  faster"
+        print(f"{name:<28} {old['median'] * 1000:>10.3f}ms {result['median'] * 1000:>10.3f}ms "
+              f"{ratio:>7.2f}x{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the seo_studio hot paths.")
+    parser.add_argument("-o", "--output", help="write results as JSON to this path")
+    parser.add_argument("--only", default=None, help="comma-separated case names or glob patterns")
+    parser.add_argument("--quick", action="store_true", help="smaller documents and batches, fewer repeats")
+    parser.add_argument("--repeats", type=int, default=None, help="timing rounds per case (default: 5, quick: 3)")
+    parser.add_argument("--min-time", type=float, default=None, help="minimum seconds per round")
+    parser.add_argument("--compare", default=None, help="baseline JSON from an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.10, help="ratio change reported as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit 1 if any case regressed")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for bench in BENCHMARKS:
+            for param in bench["params"]:
+                print(case_name(bench, param))
+        return 0
+
+    patterns = [p.strip() for p in args.only.split(",")] if args.only else None
+    repeats = args.repeats or (3 if args.quick else 5)
+    min_time = args.min_time if args.min_time is not None else (0.05 if args.quick else 0.2)
+    results = run_benchmarks(patterns, args.quick, repeats, min_time)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"meta": metadata(), "results": results}, f, indent=2)
+            f.write("\n")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+"""Core logic behind SEO Blog Studio, usable without Streamlit."""
+from .analysis import analyze_chunks, analyze_content
+from .content import content_outline, generate_content, iter_content, write_content
+from .keywords import KEYWORD_DATABASE, get_keyword_data, keyword_rng, mock_keyword_data
+from .templates import BLOG_TYPES, title_templates
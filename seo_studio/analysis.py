@@ -0,0 +1,42 @@
+"""SEO metrics for a generated post."""
+from .readability import readability_scores
+from .textscan import scan_chunks, scan_text
+
+
+def text_metrics(stats):
+    """Return word/sentence/paragraph counts and readability scores for scanned ``stats``."""
+    scores = readability_scores(stats)
+
+    return {
+        "word_count": stats["words"],
+        "sentence_count": stats["sentences"],
+        "paragraph_count": stats["paragraphs"],
+        "readability": scores["flesch_reading_ease"],
+        "flesch_kincaid_grade": scores["flesch_kincaid_grade"],
+        "gunning_fog": scores["gunning_fog"],
+        "smog_index": scores["smog_index"],
+    }
+
+
+def keyword_frequencies(stats, top_n=10):
+    """Return the total term count and the ``top_n`` most frequent terms."""
+    return {
+        "total_terms": stats["words"],
+        "top_keywords": stats["terms"].most_common(top_n),
+    }
+
+
+def _metrics(stats, top_n):
+    metrics = text_metrics(stats)
+    metrics.update(keyword_frequencies(stats, top_n))
+    return metrics
+
+
+def analyze_content(content, top_n=10):
+    """Return word/sentence/paragraph counts, readability and top keywords."""
+    return _metrics(scan_text(content), top_n)
+
+
+def analyze_chunks(chunks, top_n=10):
+    """Like :func:`analyze_content` for text arriving as an iterable of chunks."""
+    return _metrics(scan_chunks(chunks), top_n)
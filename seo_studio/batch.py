@@ -0,0 +1,271 @@
+"""Headless batch pipeline: keyword list in, JSONL/CSV of posts and SEO metrics out.
+
+Usage::
+
+    python -m seo_studio.batch research_data.csv -o results.jsonl --workers 8
+
+Results are streamed to the output file as they complete, so memory use stays
+flat no matter how many keywords are processed.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .analysis import keyword_frequencies, text_metrics
+from .content import generate_content
+from .density import density_report
+from .export import ZipExporter, export_files
+from .keyword_graph import expand_related
+from .keywords import get_keyword_data, keyword_rng
+from .providers import KeywordClient, ProviderError, default_client, provider_from_url
+from .resources import logger
+from .scoring import CRITERIA, DEFAULT_TARGETS, score_draft
+from .shared_cache import default_shared_cache
+from .templates import BLOG_TYPES, DEFAULT_BLOG_TYPE, title_templates
+from .textscan import scan_text
+
+CSV_FIELDS = [
+    "keyword", "blog_type", "title", "volume", "difficulty", "cpc", "trend", "related",
+    "word_count", "sentence_count", "paragraph_count", "readability",
+    "flesch_kincaid_grade", "gunning_fog", "smog_index", "seo_score", *(f"score_{name}" for name in CRITERIA),
+    "top_keywords", "top_phrases", "primary_density", "lsi_coverage", "content",
+]
+
+
+def process_keyword(keyword, title_index=0, seed=None, include_content=True, blog_type=None, keyword_data=None,
+                    targets=None):
+    """Run lookup, title templating, generation, analysis and scoring for one keyword.
+
+    ``keyword_data`` skips the lookup when the metrics were already fetched;
+    ``targets`` are the scoring targets (see :data:`scoring.DEFAULT_TARGETS`).
+    """
+    if keyword_data is None:
+        keyword_data = get_keyword_data(keyword, seed=seed)
+    titles = title_templates(keyword, blog_type)
+    title = titles[title_index % len(titles)]
+    content = generate_content(keyword, title, rng=keyword_rng(keyword, seed, "content"), blog_type=blog_type)
+    # Scan and tokenize the draft once; scoring reuses both
+    stats = scan_text(content)
+    metrics = text_metrics(stats)
+    metrics.update(keyword_frequencies(stats))
+    related = expand_related(keyword, keyword_data["related"])
+    density = density_report(content, keyword, related)
+    scores = score_draft(content, keyword, related, targets, stats=stats, density=density)
+
+    record = {
+        "keyword": keyword,
+        "blog_type": blog_type or DEFAULT_BLOG_TYPE,
+        "title": title,
+        "volume": keyword_data["volume"],
+        "difficulty": keyword_data["difficulty"],
+        "cpc": keyword_data["cpc"],
+        "trend": keyword_data["trend"],
+        "related": related,
+    }
+    record.update(metrics)
+    record["top_phrases"] = [(phrase, count) for phrase, count, _ in density["top_phrases"]]
+    record["primary_density"] = density["primary_density"]
+    record["lsi_coverage"] = density["lsi_coverage"]
+    record["seo_score"] = scores["seo_score"]
+    record.update((f"score_{name}", scores[name]) for name in CRITERIA)
+    if include_content:
+        record["content"] = content
+    return record
+
+
+def _process_chunk(chunk, title_index, seed, include_content, blog_type, prefetched=None, targets=None,
+                   exports=None):
+    prefetched = prefetched or {}
+    records = [process_keyword(kw, title_index, seed, include_content or bool(exports), blog_type,
+                               prefetched.get(kw), targets)
+               for kw in chunk]
+    if exports:
+        # Render the archive files here, in the worker, so the parent only writes them
+        for record in records:
+            record["exports"] = export_files(record, exports)
+            if not include_content:
+                record.pop("content")
+    return records
+
+
+def read_keywords(path):
+    """Yield keywords from a CSV (``keyword`` column or first column) or text file."""
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            column = 0
+            if "keyword" in [h.strip().lower() for h in header]:
+                column = [h.strip().lower() for h in header].index("keyword")
+            elif header and header[0].strip():
+                yield header[0].strip()
+            for row in reader:
+                if len(row) > column and row[column].strip():
+                    yield row[column].strip()
+        else:
+            for line in f:
+                if line.strip():
+                    yield line.strip()
+
+
+def _chunks(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_results(keywords, workers=None, chunksize=64, title_index=0, seed=None,
+                 include_content=True, blog_type=None, client=None, targets=None, exports=None):
+    """Yield one record per keyword, in input order.
+
+    With ``workers`` > 1 chunks are fanned out to a process pool; at most a few
+    chunks per worker are in flight at once so the input can be a lazy stream.
+    With a provider ``client`` each chunk's metrics are fetched concurrently in
+    this process before the chunk is handed to a worker. With ``exports`` (a
+    tuple of formats) each record also carries its rendered ZIP files under
+    ``"exports"`` (see :func:`export.export_files`).
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in _chunks(keywords, chunksize):
+            yield from _process_chunk(chunk, title_index, seed, include_content, blog_type,
+                                      _prefetch(client, chunk), targets, exports)
+        return
+
+    max_pending = workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunks(keywords, chunksize):
+            pending.append(pool.submit(_process_chunk, chunk, title_index, seed, include_content, blog_type,
+                                       _prefetch(client, chunk), targets, exports))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _prefetch(client, chunk):
+    if client is None:
+        return None
+    try:
+        return client.lookup_many(chunk)
+    except (ProviderError, TimeoutError) as e:
+        # Fall back to per-keyword local lookups in the workers
+        logger.warning("keyword provider failed (%s); using local data for %d keywords", e, len(chunk))
+        return None
+
+
+class _JsonlWriter:
+    def __init__(self, f):
+        self.f = f
+
+    def write(self, record):
+        self.f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+class _CsvWriter:
+    def __init__(self, f):
+        self.writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        self.writer.writeheader()
+
+    def write(self, record):
+        row = dict(record)
+        row["related"] = "|".join(record["related"])
+        row["top_keywords"] = "|".join(f"{kw}:{freq}" for kw, freq in record["top_keywords"])
+        row["top_phrases"] = "|".join(f"{phrase}:{freq}" for phrase, freq in record["top_phrases"])
+        self.writer.writerow(row)
+
+
+def run_batch(keywords, out, fmt="jsonl", zip_out=None, zip_formats=("md", "docx"), include_content=True,
+              **kwargs):
+    """Stream results for ``keywords`` to the open file ``out``; return the count.
+
+    With ``zip_out`` (a binary file object) each post and its SEO report are also
+    appended to a ZIP archive as they complete.
+    """
+    writer = None
+    if out is not None:
+        writer = _CsvWriter(out) if fmt == "csv" else _JsonlWriter(out)
+    exporter = ZipExporter(zip_out, formats=zip_formats) if zip_out is not None else None
+    count = 0
+    try:
+        exports = tuple(zip_formats) if exporter is not None else None
+        for record in iter_results(keywords, include_content=include_content, exports=exports, **kwargs):
+            if exporter is not None:
+                exporter.add(record, record.pop("exports"))
+            if writer is not None:
+                writer.write(record)
+            count += 1
+    finally:
+        if exporter is not None:
+            exporter.close()
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate and analyze SEO posts for a keyword list.")
+    parser.add_argument("input", help="CSV (keyword column) or text file with one keyword per line")
+    parser.add_argument("-o", "--output", default="-", help="output path (default: stdout)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="output format (default: from extension)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=64, help="keywords per worker task")
+    parser.add_argument("--blog-type", choices=BLOG_TYPES, default=None, help="content template (default: Ultimate Guide)")
+    parser.add_argument("--title-index", type=int, default=0, help="which title template to use")
+    parser.add_argument("--seed", default=None, help="seed for mock metrics and generated text (default: SEO_MOCK_SEED)")
+    parser.add_argument("--no-content", action="store_true", help="omit the generated post from the output")
+    parser.add_argument("--zip", default=None, help="also write posts and SEO reports to this ZIP archive")
+    parser.add_argument("--provider-url", default=None,
+                        help="keyword data API to fetch metrics from (default: SEO_PROVIDER_URL, else local data)")
+    parser.add_argument("--provider-rate", type=float, default=None, help="max provider requests per second")
+    parser.add_argument("--target-word-count", type=int, default=DEFAULT_TARGETS["word_count"],
+                        help="word count the SEO score aims for")
+    parser.add_argument("--target-keywords", type=int, default=DEFAULT_TARGETS["keywords"],
+                        help="related terms each post should cover")
+    parser.add_argument("--target-readability", type=int, default=DEFAULT_TARGETS["readability"],
+                        help="Flesch reading ease the SEO score aims for")
+    parser.add_argument("--zip-formats", default="md,docx", help="post formats inside the ZIP (md, txt, html, docx)")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.output.lower().endswith(".csv") else "jsonl")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    zip_out = open(args.zip, "wb") if args.zip else None
+    if args.provider_url:
+        client = KeywordClient(provider_from_url(args.provider_url), rate=args.provider_rate,
+                               shared=default_shared_cache())
+    else:
+        client = default_client()
+    start = time.perf_counter()
+    try:
+        count = run_batch(
+            read_keywords(args.input), out, fmt=fmt,
+            zip_out=zip_out, zip_formats=tuple(args.zip_formats.split(",")),
+            workers=args.workers, chunksize=args.chunksize,
+            title_index=args.title_index, seed=args.seed, blog_type=args.blog_type,
+            include_content=not args.no_content, client=client,
+            targets={"word_count": args.target_word_count, "keywords": args.target_keywords,
+                     "readability": args.target_readability},
+        )
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if zip_out is not None:
+            zip_out.close()
+        if client is not None:
+            client.close()
+    print(f"Processed {count} keywords in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Word cloud and Plotly chart builders backed by the render cache."""
+import random
+from io import BytesIO
+
+from .render_cache import cache_key, default_cache
+from .resources import lazy_import
+
+RADAR_CATEGORIES = ['Volume', 'Difficulty', 'CPC', 'Competition', 'Opportunity']
+
+# Anchor colours of matplotlib's viridis, so the default cloud needs no colormap (and no pyplot)
+VIRIDIS = ((68, 1, 84), (59, 82, 139), (33, 145, 140), (94, 201, 98), (253, 231, 37))
+
+
+def _encode_figure(fig):
+    return fig.to_json().encode("utf-8")
+
+
+def _decode_figure(data):
+    return lazy_import("plotly.io").from_json(data.decode("utf-8"))
+
+
+def keyword_weights(primary, related, primary_weight=10, related_weight=5):
+    """Return word-cloud weights for the primary keyword and its related terms."""
+    weights = {term: related_weight for term in related}
+    weights[primary] = max(primary_weight, weights.get(primary, 0))
+    return weights
+
+
+def palette_color_func(palette=VIRIDIS):
+    """Return a WordCloud ``color_func`` picking random points along ``palette``."""
+    def color_func(word, font_size, position, orientation, random_state=None, **kwargs):
+        x = (random_state or random).random() * (len(palette) - 1)
+        i = min(int(x), len(palette) - 2)
+        f = x - i
+        return "rgb(%d, %d, %d)" % tuple(round(a + (b - a) * f) for a, b in zip(palette[i], palette[i + 1]))
+    return color_func
+
+
+def wordcloud_png(words, width=400, height=300, scale=1, background_color='#0e1117', colormap=None,
+                  max_font_size=None, font_step=2, cache=default_cache):
+    """Return the keyword cloud as PNG bytes of ``width * scale`` x ``height * scale`` pixels.
+
+    ``words`` is a ``{term: weight}`` dict (laid out as given, phrases intact) or
+    plain text to tokenize. The cloud is written straight to PNG with
+    ``to_image()``; a named matplotlib ``colormap`` is optional. A fixed
+    ``max_font_size`` (default 40% of the height) skips WordCloud's trial layout
+    pass, and ``font_step`` trades fit precision for speed.
+    """
+    if max_font_size is None:
+        max_font_size = height * 2 // 5
+    def render():
+        WordCloud = lazy_import("wordcloud").WordCloud
+        colors = {"colormap": colormap} if colormap else {"color_func": palette_color_func()}
+        wordcloud = WordCloud(width=width, height=height, scale=scale, background_color=background_color,
+                              max_font_size=max_font_size, font_step=font_step, random_state=0, **colors)
+        if isinstance(words, str):
+            wordcloud.generate(words)
+        else:
+            wordcloud.generate_from_frequencies(words)
+        buffer = BytesIO()
+        wordcloud.to_image().save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    content = words if isinstance(words, str) else sorted(words.items())
+    key = cache_key("wordcloud", content, width, height, scale, background_color, colormap, max_font_size, font_step)
+    return cache.get_or_render(key, render, suffix=".png")
+
+
+def radar_figure(name, values, categories=RADAR_CATEGORIES, cache=default_cache):
+    """Return the keyword metrics radar chart."""
+    def render():
+        go = lazy_import("plotly.graph_objects")
+        fig = go.Figure()
+        fig.add_trace(go.Scatterpolar(
+            r=list(values),
+            theta=list(categories),
+            fill='toself',
+            name=name,
+            line_color='#667eea'
+        ))
+        fig.update_layout(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 100]
+                )),
+            showlegend=True,
+            template='plotly_dark',
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            height=400
+        )
+        return fig
+
+    key = cache_key("radar", name, list(values), list(categories))
+    return cache.get_or_render(key, render, suffix=".json", encode=_encode_figure, decode=_decode_figure)
+
+
+def density_figure(rows, cache=default_cache):
+    """Return the keyword density bar chart for ``(keyword, frequency, density)`` rows."""
+    def render():
+        px = lazy_import("plotly.express")
+        fig = px.bar(x=[row[0] for row in rows], y=[row[2] for row in rows],
+                     color=[row[2] for row in rows],
+                     color_continuous_scale='viridis',
+                     labels={'x': 'Keyword', 'y': 'Density (%)', 'color': 'Density (%)'},
+                     title='Top Keyword Density')
+        fig.update_layout(template='plotly_dark',
+                          paper_bgcolor='rgba(0,0,0,0)',
+                          plot_bgcolor='rgba(0,0,0,0)')
+        return fig
+
+    key = cache_key("density", [list(row) for row in rows])
+    return cache.get_or_render(key, render, suffix=".json", encode=_encode_figure, decode=_decode_figure)
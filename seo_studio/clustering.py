@@ -0,0 +1,446 @@
+"""Keyword clustering and content-plan generation for large keyword lists.
+
+Usage::
+
+    python -m seo_studio.clustering keywords.csv -o plan.jsonl --clusters 200
+
+Each keyword becomes a sparse TF-IDF vector of its words and word pairs
+(features are numbered from their hashes). The vectors are grouped with
+mini-batch spherical k-means, seeded with greedy k-means++; the centers are
+sparse too, so comparing a keyword with every center only touches the
+centers that share one of its features, and memory stays bounded at
+``O(keywords + clusters)`` plus one fixed-size similarity block even for 100k
+keywords. Each cluster gets a primary keyword (highest volume, else the most
+central) and an outline from the blog templates.
+"""
+import argparse
+import csv
+import io
+import itertools
+import json
+import sys
+import time
+import zlib
+from array import array
+
+import numpy as np
+
+from .content import content_outline
+from .keyword_graph import WORD_RE
+from .keyword_store import default_store, normalize
+from .resources import stopword_set
+from .templates import BLOG_TYPES, DEFAULT_BLOG_TYPE, title_templates
+
+# Without an explicit cluster count, aim for about this many keywords per cluster
+KEYWORDS_PER_CLUSTER = 20
+MAX_AUTO_CLUSTERS = 2000
+
+# Upper bound on the size of the keywords-by-cluster similarity block
+SIMILARITY_BLOCK = 1_000_000
+# Rounds of re-seeding empty clusters after training
+EMPTY_RESEEDS = 3
+
+PLAN_FIELDS = ["cluster", "primary", "title", "blog_type", "size", "volume", "keywords", "outline"]
+
+
+def keyword_hashes(keywords, stopwords=None):
+    """Hash each keyword's words and adjacent word pairs; return ``(indptr, hashes)``.
+
+    Stopwords are dropped unless a keyword has nothing else. The result is a
+    ragged array: keyword ``i`` owns ``hashes[indptr[i]:indptr[i + 1]]``.
+    """
+    if stopwords is None:
+        stopwords = stopword_set()
+    indptr = array("q", [0])
+    hashes = array("I")
+    for keyword in keywords:
+        words = WORD_RE.findall(keyword.lower())
+        words = [w for w in words if w not in stopwords] or words
+        features = set(words)
+        features.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+        hashes.extend(zlib.crc32(feature.encode("utf-8")) for feature in features)
+        indptr.append(len(hashes))
+    return np.frombuffer(indptr, dtype=np.int64), np.frombuffer(hashes, dtype=np.uint32).astype(np.int64)
+
+
+def feature_ids(hashes):
+    """Number the distinct feature hashes; return ``(ids, n_features)``."""
+    features, ids = np.unique(hashes, return_inverse=True)
+    return ids.ravel(), len(features)
+
+
+def idf_weights(indptr, ids, n_features):
+    """Smoothed IDF per feature, as in scikit-learn's ``TfidfVectorizer``."""
+    df = np.bincount(ids, minlength=n_features)
+    n = len(indptr) - 1
+    return np.log((1 + n) / (1 + df)) + 1
+
+
+def _ranges(starts, lengths):
+    """Concatenate ``arange(start, start + length)`` for each pair, without a Python loop."""
+    return np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(int(lengths.sum()))
+
+
+def embed(rows, indptr, ids, idf):
+    """Return unit-length sparse TF-IDF vectors for the keywords at ``rows`` as CSR ``(indptr, cols, values)``.
+
+    Keywords without tokens get an empty row.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    starts = indptr[rows]
+    lengths = indptr[rows + 1] - starts
+    cols = ids[_ranges(starts, lengths)]
+    values = idf[cols]
+    owner = np.repeat(np.arange(len(rows)), lengths)
+    norms = np.sqrt(np.bincount(owner, weights=values ** 2, minlength=len(rows)))
+    row_ptr = np.concatenate(([0], np.cumsum(lengths)))
+    return row_ptr, cols, values / norms[owner]
+
+
+class _Centers:
+    """Sparse unit-length cluster centers for spherical k-means.
+
+    Entries are kept sorted by ``feature * k + center``, so the centers that
+    share a feature with a keyword are one contiguous run. Center ``j`` is its
+    entries times ``scale[j]``, which lets a mini-batch update touch only the
+    batch's features.
+    """
+
+    def __init__(self, k, vectors):
+        self.k = k
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.centers = np.zeros(0, dtype=np.int64)
+        self.values = np.zeros(0, dtype=np.float64)
+        self.scale = np.ones(k, dtype=np.float64)
+        self.reset(np.arange(k), vectors)
+
+    def reset(self, centers, vectors):
+        """Replace ``centers`` with the CSR ``vectors`` (one row each)."""
+        row_ptr, cols, values = vectors
+        keep = ~np.isin(self.centers, centers)
+        keys = np.concatenate((self.keys[keep], cols * self.k + np.repeat(centers, np.diff(row_ptr))))
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.centers = self.keys % self.k
+        self.values = np.concatenate((self.values[keep], values))[order]
+        self.scale[centers] = 1
+
+    def similarity(self, vectors):
+        """Return the ``(rows, k)`` cosine similarities of the CSR ``vectors`` to every center."""
+        row_ptr, cols, values = vectors
+        n = len(row_ptr) - 1
+        starts = np.searchsorted(self.keys, cols * self.k)
+        lengths = np.searchsorted(self.keys, (cols + 1) * self.k) - starts
+        idx = _ranges(starts, lengths)
+        base = np.repeat(np.repeat(np.arange(n) * self.k, np.diff(row_ptr)), lengths)
+        weights = self.values[idx] * np.repeat(values, lengths)
+        scores = np.bincount(base + self.centers[idx], weights=weights, minlength=n * self.k)
+        return scores.reshape(n, self.k) * self.scale
+
+    def update(self, vectors, labels, counts):
+        """Move the centers towards their keywords in the batch ``vectors``; return the mean shift."""
+        k = self.k
+        row_ptr, cols, values = vectors
+        batch_counts = np.bincount(labels, minlength=k)
+        hit = np.flatnonzero(batch_counts)
+        owner = labels[np.repeat(np.arange(len(labels)), np.diff(row_ptr))]
+        keys, inverse = np.unique(cols * k + owner, return_inverse=True)
+        center = keys % k
+        mean = np.bincount(inverse.ravel(), weights=values, minlength=len(keys)) / batch_counts[center]
+        counts[hit] += batch_counts[hit]
+        # Per-center learning rate of 1/count, as in Sculley's mini-batch k-means
+        rate = batch_counts / counts
+        pos = np.searchsorted(self.keys, keys)
+        found = pos < len(self.keys)
+        found[found] = self.keys[pos[found]] == keys[found]
+        dot = np.bincount(center[found], weights=self.values[pos[found]] * mean[found], minlength=k) * self.scale
+        mean_sq = np.bincount(center, weights=mean ** 2, minlength=k)
+        norm = np.sqrt((1 - rate) ** 2 + 2 * (1 - rate) * rate * dot + rate ** 2 * mean_sq)
+        shift = float(np.mean(1 - ((1 - rate[hit]) + rate[hit] * dot[hit]) / norm[hit]))
+
+        # new center = ((1 - rate) * center + rate * mean) / norm, written to the batch's entries only
+        delta = rate[center] * mean / ((1 - rate[center]) * self.scale[center])
+        self.values[pos[found]] += delta[found]
+        self.keys = np.insert(self.keys, pos[~found], keys[~found])
+        self.centers = np.insert(self.centers, pos[~found], center[~found])
+        self.values = np.insert(self.values, pos[~found], delta[~found])
+        self.scale[hit] *= (1 - rate[hit]) / norm[hit]
+        small = hit[self.scale[hit] < 1e-6]
+        if len(small):
+            rescale = np.isin(self.centers, small)
+            self.values[rescale] *= self.scale[self.centers[rescale]]
+            self.scale[small] = 1
+        return shift
+
+
+def _seed_centers(sample, k, rng):
+    """Pick ``k`` rows of the CSR ``sample`` as initial centers with greedy k-means++; return their indices.
+
+    Each step draws a few candidates weighted by their squared distance to
+    the nearest center so far and keeps the one that lowers the total most.
+    """
+    row_ptr, cols, values = sample
+    n = len(row_ptr) - 1
+    owner = np.repeat(np.arange(n), np.diff(row_ptr))
+    # Column-sorted copy of the sample, to find the rows sharing a candidate's features
+    order = np.argsort(cols, kind="stable")
+    by_col, col_rows, col_values = cols[order], owner[order], values[order]
+    trials = 2 + int(np.log(k))
+
+    def similarities(candidates):
+        starts, ends = row_ptr[candidates], row_ptr[candidates + 1]
+        entries = _ranges(starts, ends - starts)
+        lo = np.searchsorted(by_col, cols[entries])
+        lengths = np.searchsorted(by_col, cols[entries], side="right") - lo
+        idx = _ranges(lo, lengths)
+        which = np.repeat(np.repeat(np.arange(len(candidates)), ends - starts), lengths)
+        weights = col_values[idx] * np.repeat(values[entries], lengths)
+        return np.bincount(which * n + col_rows[idx], weights=weights,
+                           minlength=len(candidates) * n).reshape(len(candidates), n)
+
+    chosen = [int(rng.integers(n))]
+    best = similarities(np.array(chosen))[0]
+    for _ in range(1, k):
+        # Squared distance between unit vectors: far keywords are likelier seeds
+        distance = np.maximum(2 - 2 * best, 0)
+        total = distance.sum()
+        candidates = rng.choice(n, size=trials, p=distance / total) if total > 0 else rng.choice(n, size=trials)
+        merged = np.maximum(best, similarities(candidates))
+        pick = int(np.argmax(merged.sum(axis=1)))
+        chosen.append(int(candidates[pick]))
+        best = merged[pick]
+    return np.array(chosen)
+
+
+def auto_clusters(n):
+    """Default cluster count for ``n`` keywords."""
+    return int(min(MAX_AUTO_CLUSTERS, max(1, round(n / KEYWORDS_PER_CLUSTER))))
+
+
+def _chunks(n, size):
+    for start in range(0, n, size):
+        yield np.arange(start, min(n, start + size))
+
+
+def _assign(centers, indptr, ids, idf):
+    n = len(indptr) - 1
+    labels = np.empty(n, dtype=np.int32)
+    similarity = np.empty(n, dtype=np.float32)
+    for rows in _chunks(n, max(256, SIMILARITY_BLOCK // centers.k)):
+        scores = centers.similarity(embed(rows, indptr, ids, idf))
+        labels[rows] = np.argmax(scores, axis=1)
+        similarity[rows] = scores[np.arange(len(rows)), labels[rows]]
+    return labels, similarity
+
+
+def cluster_keywords(keywords, n_clusters=None, batch_size=2048, max_iter=None, tol=1e-4, seed=0):
+    """Cluster ``keywords`` by shared tokens; return ``(labels, similarity)`` arrays.
+
+    ``labels[i]`` is keyword ``i``'s cluster and ``similarity[i]`` its cosine
+    similarity to the cluster centroid. Centers are seeded k-means++ style
+    from a sample, trained on random mini-batches of ``batch_size`` keywords
+    for at most ``max_iter`` steps (stopping early once they move less than
+    ``tol``), and clusters left empty are re-seeded from the keywords that
+    fit their own cluster worst.
+    """
+    keywords = list(keywords)
+    n = len(keywords)
+    if n == 0:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+    k = min(n, n_clusters or auto_clusters(n))
+    indptr, hashes = keyword_hashes(keywords)
+    ids, n_features = feature_ids(hashes)
+    idf = idf_weights(indptr, ids, n_features)
+    rng = np.random.default_rng(seed)
+    batch_size = min(batch_size, n, max(1, SIMILARITY_BLOCK // k))
+
+    sample = rng.choice(n, size=min(n, max(3 * batch_size, 3 * k)), replace=False)
+    seeds = sample[_seed_centers(embed(sample, indptr, ids, idf), k, rng)]
+    centers = _Centers(k, embed(seeds, indptr, ids, idf))
+    # Each seed counts as one keyword, so a center never jumps straight to one batch's mean
+    counts = np.ones(k, dtype=np.float64)
+
+    if max_iter is None:
+        max_iter = int(min(500, max(50, 3 * n // batch_size)))
+    for _ in range(max_iter):
+        batch = embed(rng.choice(n, size=batch_size, replace=False), indptr, ids, idf)
+        labels = np.argmax(centers.similarity(batch), axis=1)
+        if centers.update(batch, labels, counts) < tol:
+            break
+
+    labels, similarity = _assign(centers, indptr, ids, idf)
+    for _ in range(EMPTY_RESEEDS):
+        empty = np.setdiff1d(np.arange(k), labels)
+        if not len(empty):
+            break
+        # Move each empty center onto one of the keywords that fit their cluster worst
+        farthest = np.argsort(similarity, kind="stable")[:len(empty)]
+        centers.reset(empty, embed(farthest, indptr, ids, idf))
+        labels, similarity = _assign(centers, indptr, ids, idf)
+    return labels, similarity
+
+
+def content_plan(keywords, labels, similarity, volumes=None, blog_type=None, max_keywords=10):
+    """Yield one plan entry per cluster, biggest opportunity first.
+
+    The primary keyword is the cluster's highest-volume keyword when
+    ``volumes`` are known (ties go to the most central one), otherwise the most
+    central one. ``keywords`` lists up to ``max_keywords`` supporting keywords
+    in the same order.
+    """
+    if not len(labels):
+        return
+    volume_array = np.zeros(len(labels)) if volumes is None else \
+        np.array([v or 0 for v in volumes], dtype=np.float64)
+    order = np.lexsort((-similarity, -volume_array, labels))
+    sorted_labels = labels[order]
+    starts = np.flatnonzero(np.r_[True, sorted_labels[1:] != sorted_labels[:-1]])
+    ends = np.r_[starts[1:], len(order)]
+    sizes = ends - starts
+    totals = np.add.reduceat(volume_array[order], starts)
+    # Largest total volume first, then the largest clusters
+    for rank, group in enumerate(np.lexsort((-sizes, -totals))):
+        members = order[starts[group]:ends[group]]
+        primary = keywords[members[0]]
+        yield {
+            "cluster": rank,
+            "primary": primary,
+            "title": title_templates(primary, blog_type)[0],
+            "blog_type": blog_type or DEFAULT_BLOG_TYPE,
+            "size": int(sizes[group]),
+            "volume": None if volumes is None else int(totals[group]),
+            "keywords": [keywords[i] for i in members[1:max_keywords + 1]],
+            "outline": content_outline(primary, blog_type),
+        }
+
+
+def build_content_plan(keywords, volumes=None, n_clusters=None, blog_type=None, max_keywords=10, seed=0):
+    """Cluster ``keywords`` and return the content plan as a list."""
+    keywords = list(keywords)
+    labels, similarity = cluster_keywords(keywords, n_clusters=n_clusters, seed=seed)
+    return list(content_plan(keywords, labels, similarity, volumes, blog_type, max_keywords))
+
+
+def _parse_volume(value):
+    try:
+        return int(float(str(value).replace(",", "")))
+    except (TypeError, ValueError):
+        return None
+
+
+def read_keyword_file(f, csv_input=True, store=None):
+    """Read ``(keywords, volumes)`` from an open CSV or text file, deduplicated.
+
+    CSVs use their ``keyword`` column (else the first column) and an optional
+    ``volume`` column. Missing volumes are looked up in ``store`` when given;
+    ``volumes`` is ``None`` when none are known at all.
+    """
+    keywords, volumes, seen = [], [], {}
+    if csv_input:
+        reader = csv.reader(f)
+        first = next(reader, [])
+        header = [h.strip().lower() for h in first]
+        keyword_col = header.index("keyword") if "keyword" in header else 0
+        volume_col = header.index("volume") if "volume" in header else None
+        if "keyword" not in header:
+            # No header row: the first line is a keyword too
+            reader = itertools.chain([first], reader)
+        rows = ((row[keyword_col] if len(row) > keyword_col else "",
+                 row[volume_col] if volume_col is not None and len(row) > volume_col else None)
+                for row in reader)
+    else:
+        rows = ((line, None) for line in f)
+    for keyword, volume in rows:
+        keyword = normalize(keyword)
+        if not keyword:
+            continue
+        volume = _parse_volume(volume)
+        if volume is None and store is not None:
+            data = store.lookup(keyword)
+            volume = data["volume"] if data else None
+        if keyword in seen:
+            i = seen[keyword]
+            if volume is not None and (volumes[i] is None or volume > volumes[i]):
+                volumes[i] = volume
+            continue
+        seen[keyword] = len(keywords)
+        keywords.append(keyword)
+        volumes.append(volume)
+    if all(v is None for v in volumes):
+        volumes = None
+    return keywords, volumes
+
+
+def plan_markdown(plan):
+    """Render a content plan as a markdown document."""
+    parts = ["# Content Plan\n\n"]
+    for entry in plan:
+        parts.append(f"## {entry['cluster'] + 1}. {entry['title']}\n\n")
+        volume = f" · {entry['volume']:,} monthly searches" if entry["volume"] is not None else ""
+        parts.append(f"**Primary keyword:** {entry['primary']} ({entry['size']} keywords{volume})\n\n")
+        if entry["keywords"]:
+            parts.append(f"**Supporting keywords:** {', '.join(entry['keywords'])}\n\n")
+        parts.append("**Outline:**\n\n")
+        parts.extend(f"- {heading.lstrip('# ')}\n" for heading in entry["outline"])
+        parts.append("\n")
+    return "".join(parts)
+
+
+def write_plan(plan, out, fmt="jsonl"):
+    """Write plan entries to the open text file ``out``; return how many were written."""
+    count = 0
+    if fmt == "md":
+        plan = list(plan)
+        out.write(plan_markdown(plan))
+        return len(plan)
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=PLAN_FIELDS)
+        writer.writeheader()
+    for entry in plan:
+        if fmt == "csv":
+            writer.writerow(dict(entry, keywords="|".join(entry["keywords"]), outline="|".join(entry["outline"])))
+        else:
+            out.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def plan_bytes(plan, fmt="jsonl"):
+    """Return the plan serialized as ``fmt`` (jsonl, csv or md), for downloads."""
+    buffer = io.StringIO(newline="")
+    write_plan(plan, buffer, fmt)
+    return buffer.getvalue().encode("utf-8")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cluster a keyword list into a content plan.")
+    parser.add_argument("input", help="CSV (keyword and optional volume columns) or text file with one keyword per line")
+    parser.add_argument("-o", "--output", default="-", help="output path (default: stdout)")
+    parser.add_argument("--format", choices=["jsonl", "csv", "md"], help="output format (default: from extension)")
+    parser.add_argument("--clusters", type=int, default=None,
+                        help=f"number of clusters (default: one per {KEYWORDS_PER_CLUSTER} keywords)")
+    parser.add_argument("--blog-type", choices=BLOG_TYPES, default=None, help="content template (default: Ultimate Guide)")
+    parser.add_argument("--max-keywords", type=int, default=10, help="supporting keywords listed per cluster")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the clustering")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    with open(args.input, newline="", encoding="utf-8") as f:
+        keywords, volumes = read_keyword_file(f, args.input.lower().endswith(".csv"), store=default_store())
+    labels, similarity = cluster_keywords(keywords, n_clusters=args.clusters, seed=args.seed)
+    plan = content_plan(keywords, labels, similarity, volumes, args.blog_type, args.max_keywords)
+
+    ext = args.output.lower().rsplit(".", 1)[-1]
+    fmt = args.format or (ext if ext in ("csv", "md") else "jsonl")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        count = write_plan(plan, out, fmt)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"Clustered {len(keywords)} keywords into {count} topics in {time.perf_counter() - start:.1f}s",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""Blog post generation from a keyword and a title."""
+import random
+
+from .templates import get_template
+
+
+def content_outline(keyword, blog_type=None):
+    """Return the section headings used for a post about ``keyword``."""
+    return get_template(blog_type).outline(keyword)
+
+
+def iter_content(keyword, title, rng=random, sections=None, blog_type=None):
+    """Yield a markdown blog post section by section."""
+    return get_template(blog_type).iter_sections(keyword, title, rng=rng, sections=sections)
+
+
+def generate_content(keyword, title, rng=random, sections=None, blog_type=None):
+    """Return a markdown blog post for ``keyword`` headed by ``title``."""
+    return "".join(iter_content(keyword, title, rng=rng, sections=sections, blog_type=blog_type))
+
+
+def write_content(f, keyword, title, rng=random, sections=None, blog_type=None):
+    """Write the post to the open text file ``f`` without building it in memory."""
+    for part in iter_content(keyword, title, rng=rng, sections=sections, blog_type=blog_type):
+        f.write(part)
@@ -0,0 +1,285 @@
+"""Stopword-aware keyword density over 1-3 word phrases, scored with NumPy.
+
+Each text is tokenized once into an integer id array over its own vocabulary
+(so nothing accumulates between drafts), with a :data:`BREAK` id at sentence
+ends and line breaks so no phrase spans two sentences or a heading and its
+text; every n-gram is encoded as a single int64 key so counting, stopword
+filtering, target matching and TF-IDF lookups are array operations rather
+than Python loops.
+"""
+import heapq
+import re
+import threading
+from collections import Counter
+
+import numpy as np
+
+from .resources import stopword_set
+
+WORD_RE = re.compile(r"\w+")
+# Words, sentence-ending punctuation and line breaks
+TOKEN_RE = re.compile(r"\w+|[.!?]+(?=\s|$)|\n")
+
+# Token ids are packed into n-gram keys with this base, so 3-grams fit in int64
+ID_BASE = 1 << 20
+# Id of sentence and line breaks; phrases never contain it
+BREAK = ID_BASE - 1
+
+
+def _mark_breaks(ids, vocab):
+    """Replace the ids of sentence ends and line breaks in ``vocab`` with :data:`BREAK`."""
+    breaks = np.fromiter((WORD_RE.match(token) is None for token in vocab.tolist()), dtype=bool, count=len(vocab))
+    if breaks.any() and len(ids):
+        ids[breaks[ids]] = BREAK
+    return ids
+
+
+class DensityEngine:
+    """Stopword list plus optional reference-corpus document frequencies.
+
+    Token ids are local to each text (indices into that text's sorted
+    vocabulary), so the engine keeps no per-draft state and one engine can
+    serve many drafts and threads for the life of the server. Pass
+    ``reference`` texts to enable TF-IDF scoring against that corpus.
+    """
+
+    def __init__(self, stopwords=None, max_n=3, reference=None):
+        self.stopwords = frozenset(stopword_set() if stopwords is None else stopwords)
+        self.max_n = max_n
+        self.n_reference = 0
+        self._ref_vocab = np.zeros(0, dtype=str)
+        self._ref_keys = {}
+        self._ref_df = {}
+        if reference:
+            self.fit(reference)
+
+    # ---------------- TOKENS ----------------
+    def token_ids(self, text):
+        """Return ``(ids, vocab)``: int64 token ids for ``text`` and the sorted token array they index.
+
+        Sentence ends and line breaks get the id :data:`BREAK`.
+        """
+        tokens = TOKEN_RE.findall(text.lower())
+        if not tokens:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=str)
+        vocab, inverse = np.unique(np.array(tokens), return_inverse=True)
+        if len(vocab) >= BREAK:
+            raise ValueError("text has too many distinct tokens for DensityEngine")
+        return _mark_breaks(inverse.ravel().astype(np.int64), vocab), vocab
+
+    def phrase_ids(self, phrase, vocab):
+        """Return the ids of ``phrase``'s tokens in ``vocab``, or ``None`` if any token is absent."""
+        tokens = WORD_RE.findall(phrase.lower())
+        if not tokens or not len(vocab):
+            return None
+        pos = np.minimum(np.searchsorted(vocab, tokens), len(vocab) - 1)
+        if not np.all(vocab[pos] == np.array(tokens)):
+            return None
+        return pos.astype(np.int64)
+
+    def _stop_mask(self, vocab):
+        return np.fromiter((token in self.stopwords for token in vocab.tolist()), dtype=bool, count=len(vocab))
+
+    @staticmethod
+    def _decode(n, key, vocab):
+        ids = []
+        for _ in range(n):
+            key, token_id = divmod(int(key), ID_BASE)
+            ids.append(str(vocab[token_id]))
+        return " ".join(reversed(ids))
+
+    # ---------------- N-GRAMS ----------------
+    def ngram_counts(self, ids, vocab):
+        """Return ``{n: (keys, counts)}`` for n-grams within one sentence, not starting or ending with a stopword."""
+        words = ids != BREAK
+        # Breaks count as stopwords, so they can't start or end a phrase either
+        stop = np.ones(len(ids), dtype=bool)
+        stop[words] = self._stop_mask(vocab)[ids[words]]
+        result = {}
+        for n in range(1, self.max_n + 1):
+            size = len(ids) - n + 1
+            if size <= 0:
+                result[n] = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+                continue
+            keys = ids[:size].copy()
+            for offset in range(1, n):
+                keys = keys * ID_BASE + ids[offset:offset + size]
+            valid = ~stop[:size] & ~stop[n - 1:n - 1 + size]
+            for offset in range(1, n - 1):
+                valid &= words[offset:offset + size]
+            keys, counts = np.unique(keys[valid], return_counts=True)
+            result[n] = (keys, counts)
+        return result
+
+    def fit(self, reference):
+        """Record phrase document frequencies over the ``reference`` texts."""
+        token_lists = [TOKEN_RE.findall(text.lower()) for text in reference]
+        self._ref_vocab = np.unique(np.array([t for tokens in token_lists for t in tokens] or [""]))
+        df = {n: [] for n in range(1, self.max_n + 1)}
+        for tokens in token_lists:
+            ids = np.searchsorted(self._ref_vocab, tokens).astype(np.int64) if tokens else np.zeros(0, np.int64)
+            ids = _mark_breaks(ids, self._ref_vocab)
+            for n, (keys, _) in self.ngram_counts(ids, self._ref_vocab).items():
+                df[n].append(keys)
+        self.n_reference = len(token_lists)
+        for n, parts in df.items():
+            keys = np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+            self._ref_keys[n], self._ref_df[n] = np.unique(keys, return_counts=True)
+        return self
+
+    def idf(self, n, keys, vocab):
+        """Smoothed inverse document frequency of n-gram ``keys`` (ids into ``vocab``) in the reference corpus."""
+        ref_keys = self._ref_keys.get(n)
+        df = np.zeros(len(keys), dtype=np.float64)
+        if ref_keys is not None and len(ref_keys) and len(keys):
+            # Translate the text's token ids into reference-vocabulary ids, digit by digit
+            pos = np.minimum(np.searchsorted(self._ref_vocab, vocab), len(self._ref_vocab) - 1)
+            ref_map = np.where(self._ref_vocab[pos] == vocab, pos, -1)
+            known = np.ones(len(keys), dtype=bool)
+            ref = np.zeros(len(keys), dtype=np.int64)
+            rest = keys.copy()
+            for place in range(n):
+                rest, digit = np.divmod(rest, ID_BASE)
+                mapped = ref_map[digit]
+                known &= mapped >= 0
+                ref += np.maximum(mapped, 0) * ID_BASE ** place
+            pos = np.minimum(np.searchsorted(ref_keys, ref), len(ref_keys) - 1)
+            found = known & (ref_keys[pos] == ref)
+            df[found] = self._ref_df[n][pos[found]]
+        return np.log((1 + self.n_reference) / (1 + df)) + 1
+
+    # ---------------- TARGETS ----------------
+    def phrase_count(self, ids, phrase_ids):
+        """Count occurrences of the token sequence ``phrase_ids`` in ``ids``."""
+        if phrase_ids is None or not len(phrase_ids):
+            return 0
+        size = len(ids) - len(phrase_ids) + 1
+        if size <= 0:
+            return 0
+        match = ids[:size] == phrase_ids[0]
+        for offset in range(1, len(phrase_ids)):
+            match &= ids[offset:offset + size] == phrase_ids[offset]
+        return int(match.sum())
+
+    def coverage_matrix(self, texts, terms):
+        """Return a ``(len(texts), len(terms))`` array of phrase occurrence counts."""
+        matrix = np.zeros((len(texts), len(terms)), dtype=np.int64)
+        for row, text in enumerate(texts):
+            ids, vocab = self.token_ids(text)
+            for col, term in enumerate(terms):
+                matrix[row, col] = self.phrase_count(ids, self.phrase_ids(term, vocab))
+        return matrix
+
+    # ---------------- REPORTS ----------------
+    def analyze(self, text, primary=None, related=(), top_n=10):
+        """Return the density report for one draft."""
+        return self._report(*self.token_ids(text), primary, related, top_n)
+
+    def analyze_many(self, texts, primary=None, related=(), top_n=10):
+        """Return density reports for a batch of drafts sharing the same targets."""
+        return [self._report(*self.token_ids(text), primary, related, top_n) for text in texts]
+
+    @staticmethod
+    def targets(primary, related):
+        """The phrases a report covers: ``primary`` first, then the other ``related`` terms."""
+        return ([primary] if primary else []) + [term for term in related if term != primary]
+
+    @staticmethod
+    def word_count(ids):
+        return int(np.count_nonzero(ids != BREAK))
+
+    def target_counts(self, ids, vocab, terms):
+        """Return ``{term: occurrences}`` in the tokenized text."""
+        return {term: self.phrase_count(ids, self.phrase_ids(term, vocab)) for term in terms}
+
+    def phrase_counts(self, ids, vocab):
+        """Return ``{n: Counter}`` of the text's phrases; counts of several texts add up to their report.
+
+        Use with :meth:`report` to keep a report current while parts of a
+        draft change.
+        """
+        grams = {}
+        for n, (keys, counts) in self.ngram_counts(ids, vocab).items():
+            words = []
+            for _ in range(n):
+                keys, token_ids = np.divmod(keys, ID_BASE)
+                words.append(vocab[token_ids].tolist())
+            grams[n] = Counter(dict(zip(map(" ".join, zip(*reversed(words))), counts.tolist())))
+        return grams
+
+    def report(self, words, grams, found, primary=None, related=(), top_n=10):
+        """Return the density report from summed :meth:`phrase_counts` and :meth:`target_counts`."""
+        candidates = []
+        tfidf = []
+        for n, counter in grams.items():
+            if not counter:
+                continue
+            cutoff = heapq.nlargest(top_n, counter.values())[-1]
+            top = sorted(((count, phrase) for phrase, count in counter.items() if count >= cutoff),
+                         key=lambda c: (-c[0], c[1].split()))[:top_n]
+            candidates.extend((count, n, phrase) for count, phrase in top)
+            if self.n_reference:
+                phrases = sorted(counter, key=str.split)
+                tokens = [phrase.split() for phrase in phrases]
+                vocab = np.unique(np.array([token for parts in tokens for token in parts]))
+                keys = np.zeros(len(phrases), dtype=np.int64)
+                for place in range(n):
+                    keys = keys * ID_BASE + np.searchsorted(vocab, [parts[place] for parts in tokens])
+                counts = np.array([counter[phrase] for phrase in phrases], dtype=np.float64)
+                scores = counts / max(words, 1) * self.idf(n, keys, vocab)
+                tfidf.extend((float(scores[i]), n, phrases[i]) for i in np.argsort(-scores, kind="stable")[:top_n])
+        return self._summary(words, candidates, tfidf, found, primary, related, top_n)
+
+    def _report(self, ids, vocab, primary, related, top_n):
+        total = self.word_count(ids)
+        candidates = []
+        tfidf = []
+        for n, (keys, counts) in self.ngram_counts(ids, vocab).items():
+            if not len(keys):
+                continue
+            top = np.argsort(-counts, kind="stable")[:top_n]
+            candidates.extend((int(counts[i]), n, self._decode(n, keys[i], vocab)) for i in top)
+            if self.n_reference:
+                scores = counts / max(total, 1) * self.idf(n, keys, vocab)
+                best = np.argsort(-scores, kind="stable")[:top_n]
+                tfidf.extend((float(scores[i]), n, self._decode(n, keys[i], vocab)) for i in best)
+        found = self.target_counts(ids, vocab, self.targets(primary, related))
+        return self._summary(total, candidates, tfidf, found, primary, related, top_n)
+
+    def _summary(self, total, candidates, tfidf, found, primary, related, top_n):
+        # Longer phrases rank above their own sub-phrases on equal counts
+        candidates.sort(key=lambda c: (-c[0], -c[1], c[2].split()))
+        tfidf.sort(key=lambda c: (-c[0], c[1], c[2].split()))
+
+        def density(count):
+            return round(count / total * 100, 2) if total else 0.0
+
+        coverage = [(term, found[term], density(found[term])) for term in self.targets(primary, related)]
+        related_hits = [count for term, count, _ in coverage[1 if primary else 0:]]
+
+        return {
+            "total_words": total,
+            "top_phrases": [(phrase, count, density(count)) for count, _, phrase in candidates[:top_n]],
+            "coverage": coverage,
+            "primary_count": coverage[0][1] if primary else 0,
+            "primary_density": coverage[0][2] if primary else 0.0,
+            "lsi_coverage": (sum(1 for count in related_hits if count) / len(related_hits)) if related_hits else 0.0,
+            "top_tfidf": [(phrase, round(score, 4)) for score, _, phrase in tfidf[:top_n]],
+        }
+
+
+_default_engine = None
+_default_lock = threading.Lock()
+
+
+def default_engine():
+    """Return the process-wide engine (English stopwords, no reference corpus)."""
+    global _default_engine
+    with _default_lock:
+        if _default_engine is None:
+            _default_engine = DensityEngine()
+        return _default_engine
+
+
+def density_report(text, primary=None, related=(), top_n=10):
+    return default_engine().analyze(text, primary, related, top_n)
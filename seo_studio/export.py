@@ -0,0 +1,235 @@
+"""In-memory export of posts to TXT/Markdown, HTML and DOCX, plus bulk ZIP archives.
+
+Everything is rendered into ``BytesIO`` buffers, never temp files. Single-post
+exports are cached by a hash of the content so reruns reuse the bytes.
+"""
+import html
+import re
+import unicodedata
+import zipfile
+from datetime import datetime
+from io import BytesIO
+
+from .render_cache import RenderCache, cache_key
+from .resources import lazy_import
+from .scoring import CRITERIA_LABELS
+
+MIME_TYPES = {
+    "txt": "text/plain",
+    "md": "text/markdown",
+    "html": "text/html",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "report": "text/plain",
+}
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+BULLET_RE = re.compile(r"^\s*[-*+]\s+(.*)$")
+BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+SLUG_RE = re.compile(r"[^a-z0-9_-]+")
+
+export_cache = RenderCache(max_items=64, max_bytes=32 * 1024 * 1024)
+
+
+def slugify(keyword, fallback="post", max_length=80):
+    """Return a file-name-safe ``[a-z0-9_-]+`` slug for ``keyword`` (``fallback`` if nothing is left)."""
+    text = unicodedata.normalize("NFKD", keyword).encode("ascii", "ignore").decode("ascii").lower()
+    slug = SLUG_RE.sub("_", text).strip("_-")[:max_length].strip("_-")
+    return slug or fallback
+
+
+def parse_markdown(content):
+    """Yield ``(kind, level, text)`` blocks: headings, bullets and paragraphs."""
+    paragraph = []
+    for line in content.splitlines():
+        heading = HEADING_RE.match(line)
+        bullet = BULLET_RE.match(line)
+        if heading or bullet or not line.strip():
+            if paragraph:
+                yield "paragraph", 0, " ".join(paragraph)
+                paragraph = []
+            if heading:
+                yield "heading", len(heading.group(1)), heading.group(2).strip()
+            elif bullet:
+                yield "bullet", 0, bullet.group(1).strip()
+        else:
+            paragraph.append(line.strip())
+    if paragraph:
+        yield "paragraph", 0, " ".join(paragraph)
+
+
+def _runs(text):
+    """Split ``text`` into ``(segment, is_bold)`` runs on ``**bold**`` markers."""
+    pos = 0
+    for match in BOLD_RE.finditer(text):
+        if match.start() > pos:
+            yield text[pos:match.start()], False
+        yield match.group(1), True
+        pos = match.end()
+    if pos < len(text):
+        yield text[pos:], False
+
+
+def to_docx(content):
+    """Render markdown ``content`` as .docx bytes."""
+    document = lazy_import("docx").Document()
+    for kind, level, text in parse_markdown(content):
+        if kind == "heading":
+            # '#' is the post title; '##' and below map to Heading 1, 2, ...
+            document.add_heading(BOLD_RE.sub(r"\1", text), level=min(level - 1, 9))
+            continue
+        paragraph = document.add_paragraph(style="List Bullet" if kind == "bullet" else None)
+        for segment, bold in _runs(text):
+            paragraph.add_run(segment).bold = bold
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _inline_html(text):
+    return "".join(f"<strong>{html.escape(s)}</strong>" if bold else html.escape(s) for s, bold in _runs(text))
+
+
+def to_html(content, title=None):
+    """Render markdown ``content`` as a standalone HTML page (bytes)."""
+    body = []
+    in_list = False
+    for kind, level, text in parse_markdown(content):
+        if kind == "bullet" and not in_list:
+            body.append("<ul>")
+            in_list = True
+        elif kind != "bullet" and in_list:
+            body.append("</ul>")
+            in_list = False
+        if kind == "heading":
+            body.append(f"<h{level}>{_inline_html(text)}</h{level}>")
+            if title is None and level == 1:
+                title = BOLD_RE.sub(r"\1", text)
+        elif kind == "bullet":
+            body.append(f"<li>{_inline_html(text)}</li>")
+        else:
+            body.append(f"<p>{_inline_html(text)}</p>")
+    if in_list:
+        body.append("</ul>")
+    page = (
+        "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+        f"<title>{html.escape(title or '')}</title>\n</head>\n<body>\n"
+        + "\n".join(body) + "\n</body>\n</html>\n"
+    )
+    return page.encode("utf-8")
+
+
+def build_report(keyword, title, metrics, top_keywords, generated_at=None):
+    """Return the plain-text SEO report for one post.
+
+    ``metrics`` needs ``word_count``, ``readability``, ``sentence_count`` and
+    ``paragraph_count``, plus ``seo_score`` and its ``score_*`` breakdown when
+    scored; ``top_keywords`` is ``(keyword, frequency, ...)`` rows.
+    """
+    generated_at = generated_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    lines = [
+        "SEO CONTENT REPORT",
+        "==================",
+        "",
+        f"Keyword: {keyword}",
+        f"Title: {title}",
+        f"Generated: {generated_at}",
+        "",
+        "METRICS:",
+        f"- Word Count: {metrics['word_count']}",
+        f"- Readability Score: {int(min(100, max(0, metrics['readability'])))}/100",
+        f"- Sentences: {metrics['sentence_count']}",
+        f"- Paragraphs: {metrics['paragraph_count']}",
+        "",
+    ]
+    if "seo_score" in metrics:
+        lines.append(f"SEO SCORE: {metrics['seo_score']:.0f}/100")
+        lines.extend(f"- {label}: {metrics['score_' + name]:.0f}/100" for name, label in CRITERIA_LABELS.items()
+                     if "score_" + name in metrics)
+        lines.append("")
+    lines += [
+        "TOP KEYWORDS:",
+    ]
+    lines.extend(f"- {row[0]}: {row[1]} times" for row in top_keywords[:5])
+    return "\n".join(lines) + "\n"
+
+
+def export_bytes(content, fmt, title=None):
+    """Return ``content`` exported as ``fmt`` (txt, md, html or docx), cached per content hash."""
+    def render():
+        if fmt == "docx":
+            return to_docx(content)
+        if fmt == "html":
+            return to_html(content, title)
+        return content.encode("utf-8")
+
+    return export_cache.get_or_render(cache_key("export", fmt, title, content), render)
+
+
+def export_files(record, formats=("md", "docx"), include_report=True):
+    """Render one post's archive files as ``{suffix: bytes}`` (``blog.md``, ``report.txt``, ...)."""
+    content = record["content"]
+    files = {}
+    for fmt in formats:
+        if fmt == "docx":
+            files[f"blog.{fmt}"] = to_docx(content)
+        elif fmt == "html":
+            files[f"blog.{fmt}"] = to_html(content, record.get("title"))
+        else:
+            files[f"blog.{fmt}"] = content.encode("utf-8")
+    if include_report:
+        top = record.get("top_phrases") or record.get("top_keywords") or []
+        report = build_report(record["keyword"], record["title"], record, top, record.get("generated_at"))
+        files["report.txt"] = report.encode("utf-8")
+    return files
+
+
+class ZipExporter:
+    """Write posts and their SEO reports into a ZIP archive as they arrive.
+
+    ``fileobj`` may be unseekable (a pipe or HTTP response), so a batch run can
+    stream the archive without holding every post in memory or on disk.
+    """
+
+    def __init__(self, fileobj, formats=("md", "docx"), include_report=True):
+        self.zip = zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED)
+        self.formats = formats
+        self.include_report = include_report
+        self._names = set()
+
+    def _name(self, stem):
+        name, n = stem, 1
+        while name in self._names:
+            n += 1
+            name = f"{stem}_{n}"
+        self._names.add(name)
+        return name
+
+    def add(self, record, files=None):
+        """Add one post: a dict with ``keyword``, ``title``, ``content`` and the analysis metrics.
+
+        ``files`` are the already rendered :func:`export_files` for the post,
+        e.g. built in a worker process; otherwise they are rendered here.
+        """
+        if files is None:
+            files = export_files(record, self.formats, self.include_report)
+        stem = self._name(slugify(record["keyword"]))
+        for suffix, data in files.items():
+            self.zip.writestr(f"{stem}/{stem}_{suffix}", data)
+
+    def close(self):
+        self.zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def zip_posts(records, formats=("md", "docx"), include_report=True):
+    """Return a ZIP (bytes) of ``records`` built entirely in memory."""
+    buffer = BytesIO()
+    with ZipExporter(buffer, formats, include_report) as exporter:
+        for record in records:
+            exporter.add(record)
+    return buffer.getvalue()
@@ -0,0 +1,146 @@
+"""Incremental re-analysis of an edited draft.
+
+The draft is split into paragraphs and each paragraph's scan and phrase counts
+are cached by a hash of its text, so an edit only re-scans the paragraphs that
+changed and the document totals are adjusted by the difference.
+"""
+import hashlib
+import re
+from collections import Counter, OrderedDict
+
+from .density import default_engine
+from .textscan import scan_text
+
+PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n\s*")
+
+
+def _digest(paragraph):
+    return hashlib.blake2b(paragraph.encode("utf-8"), digest_size=16).digest()
+
+
+def _add_counts(total, counts, factor):
+    for key, count in counts.items():
+        value = total[key] + factor * count
+        if value > 0:
+            total[key] = value
+        else:
+            del total[key]
+
+
+class IncrementalAnalyzer:
+    """Keep running document statistics for successive versions of one draft.
+
+    :meth:`update` returns a dict shaped like :func:`textscan.scan_text`; its
+    ``terms`` Counter is owned by the analyzer and must not be mutated.
+    :meth:`density` returns the ``engine``'s density report for the current
+    draft from the same per-paragraph cache.
+    """
+
+    def __init__(self, max_cached=4096, engine=None):
+        self.max_cached = max_cached
+        self._engine = engine
+        self.words = 0
+        self.sentences = 0
+        self.paragraphs = 0
+        self.syllables = 0
+        self.polysyllables = 0
+        self.terms = Counter()
+        self.density_words = 0
+        self.grams = {}
+        self._targets = {}
+        self.last_rescanned = 0
+        self._cache = OrderedDict()
+        self._current = Counter()
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            self._engine = default_engine()
+        return self._engine
+
+    def _paragraph_stats(self, digest, paragraph):
+        entry = self._cache.get(digest)
+        if entry is None:
+            ids, vocab = self.engine.token_ids(paragraph)
+            entry = {
+                "stats": scan_text(paragraph),
+                "ids": ids,
+                "vocab": vocab,
+                "words": self.engine.word_count(ids),
+                "grams": self.engine.phrase_counts(ids, vocab),
+                "targets": {},
+            }
+            self._cache[digest] = entry
+            self.last_rescanned += 1
+        else:
+            self._cache.move_to_end(digest)
+        return entry
+
+    def _target_count(self, entry, term):
+        if term not in entry["targets"]:
+            entry["targets"].update(self.engine.target_counts(entry["ids"], entry["vocab"], [term]))
+        return entry["targets"][term]
+
+    def _apply(self, entry, sign, times):
+        factor = sign * times
+        stats = entry["stats"]
+        self.words += factor * stats["words"]
+        self.sentences += factor * stats["sentences"]
+        self.paragraphs += factor * stats["paragraphs"]
+        self.syllables += factor * stats["syllables"]
+        self.polysyllables += factor * stats["polysyllables"]
+        _add_counts(self.terms, stats["terms"], factor)
+        self.density_words += factor * entry["words"]
+        for n, counts in entry["grams"].items():
+            _add_counts(self.grams.setdefault(n, Counter()), counts, factor)
+        for term in self._targets:
+            self._targets[term] += factor * self._target_count(entry, term)
+
+    def update(self, text):
+        """Re-score ``text``, re-scanning only paragraphs not seen before."""
+        self.last_rescanned = 0
+        paragraphs = {}
+        new = Counter()
+        for paragraph in PARAGRAPH_BREAK.split(text):
+            if paragraph.strip():
+                digest = _digest(paragraph)
+                paragraphs[digest] = paragraph
+                new[digest] += 1
+
+        for digest, times in (self._current - new).items():
+            self._apply(self._cache[digest], -1, times)
+        for digest, times in (new - self._current).items():
+            self._apply(self._paragraph_stats(digest, paragraphs[digest]), 1, times)
+        self._current = new
+
+        # Evict least recently used paragraphs that are no longer in the draft
+        for digest in list(self._cache):
+            if len(self._cache) <= self.max_cached:
+                break
+            if digest not in new:
+                del self._cache[digest]
+
+        return self.stats()
+
+    def density(self, primary=None, related=(), top_n=10):
+        """Return the density report of the text last passed to :meth:`update`.
+
+        Target counts are kept per paragraph too; a new target is counted
+        once over the cached paragraphs.
+        """
+        terms = self.engine.targets(primary, related)
+        self._targets = {term: self._targets[term] if term in self._targets else
+                         sum(self._target_count(self._cache[digest], term) * times
+                             for digest, times in self._current.items())
+                         for term in terms}
+        return self.engine.report(self.density_words, self.grams, self._targets, primary, related, top_n)
+
+    def stats(self):
+        return {
+            "words": self.words,
+            "sentences": self.sentences,
+            "paragraphs": self.paragraphs,
+            "syllables": self.syllables,
+            "polysyllables": self.polysyllables,
+            "terms": self.terms,
+        }
@@ -0,0 +1,190 @@
+"""Per-stage timing and memory instrumentation for dashboard reruns and batch jobs.
+
+A :class:`RunProfile` records how long each named section of a run takes and,
+with ``trace_memory``, the tracemalloc peak above the section's starting point.
+Finished runs are logged as one JSON line per stage on the ``seo_studio.perf``
+logger and folded into the process-wide :data:`metrics`, which renders
+Prometheus text (written to ``SEO_METRICS_FILE`` when set). A disabled
+profile's sections do nothing but ``yield``.
+
+``SEO_PERF=1`` turns profiling on by default.
+"""
+import functools
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+perf_logger = logging.getLogger("seo_studio.perf")
+
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def perf_enabled():
+    return os.environ.get("SEO_PERF", "").lower() in ("1", "true", "yes")
+
+
+class RunProfile:
+    """Timings (and optional memory peaks) for the sections of one run.
+
+    tracemalloc only runs while a section is open: the outermost section
+    starts it and stops it on the way out, even when the run is aborted
+    mid-section (Streamlit reruns and stops raise through the ``with``
+    block). tracemalloc is process-wide, so memory figures are approximate
+    when several sessions trace at the same time.
+    """
+
+    def __init__(self, enabled=True, trace_memory=False, labels=None):
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.labels = labels or {}
+        self.records = []
+        self.started = time.perf_counter()
+        self._stack = []
+        self._owns_tracing = False
+
+    def _fold_peak(self):
+        # reset_peak() is global, so carry the current peak into every open section first
+        peak = tracemalloc.get_traced_memory()[1]
+        for frame in self._stack:
+            frame[1] = max(frame[1], peak)
+
+    @contextmanager
+    def section(self, name):
+        """Time the body of the ``with`` block as stage ``name``."""
+        if not self.enabled:
+            yield
+            return
+        if self.trace_memory:
+            if not self._stack and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracing = True
+            self._fold_peak()
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            self._stack.append([current, current])
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            peak = None
+            if self.trace_memory:
+                self._fold_peak()
+                base, top = self._stack.pop()
+                peak = top - base
+                if not self._stack:
+                    self._stop_tracing()
+            self.record(name, seconds, peak)
+
+    def _stop_tracing(self):
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def timed(self, name=None):
+        """Decorator form of :meth:`section` (defaults to the function name)."""
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.section(name or func.__name__):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def record(self, name, seconds, peak_bytes=None):
+        if self.enabled:
+            self.records.append({"stage": name, "seconds": seconds, "peak_bytes": peak_bytes})
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def table(self):
+        """Return the records as rows for a dataframe."""
+        return [{
+            "Stage": r["stage"],
+            "ms": round(r["seconds"] * 1000, 1),
+            "Peak KiB": None if r["peak_bytes"] is None else round(r["peak_bytes"] / 1024, 1),
+        } for r in self.records]
+
+    def finish(self):
+        """Log the run and add it to :data:`metrics`."""
+        if not self.enabled:
+            return
+        for r in self.records:
+            metrics.observe(r["stage"], r["seconds"], r["peak_bytes"])
+            if perf_logger.isEnabledFor(logging.INFO):
+                perf_logger.info(json.dumps(dict(self.labels, **r)))
+        metrics.runs += 1
+        path = os.environ.get("SEO_METRICS_FILE")
+        if path:
+            metrics.write(path)
+
+
+class MetricsRegistry:
+    """Cumulative per-stage duration histograms and memory peaks for this process."""
+
+    def __init__(self, buckets=DURATION_BUCKETS):
+        self.buckets = buckets
+        self.runs = 0
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage, seconds, peak_bytes=None):
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                entry = self._stages[stage] = {"counts": [0] * len(self.buckets), "count": 0, "sum": 0.0,
+                                               "peak_bytes": None}
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    entry["counts"][i] += 1
+            entry["count"] += 1
+            entry["sum"] += seconds
+            if peak_bytes is not None:
+                entry["peak_bytes"] = max(entry["peak_bytes"] or 0, peak_bytes)
+
+    def prometheus_text(self):
+        """Render the metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP seo_runs_total Instrumented runs.",
+            "# TYPE seo_runs_total counter",
+            f"seo_runs_total {self.runs}",
+            "# HELP seo_stage_duration_seconds Time spent in each stage.",
+            "# TYPE seo_stage_duration_seconds histogram",
+        ]
+        with self._lock:
+            stages = sorted(self._stages.items())
+            for stage, entry in stages:
+                for bound, count in zip(self.buckets, entry["counts"]):
+                    lines.append(f'seo_stage_duration_seconds_bucket{{stage="{stage}",le="{bound}"}} {count}')
+                lines.append(f'seo_stage_duration_seconds_bucket{{stage="{stage}",le="+Inf"}} {entry["count"]}')
+                lines.append(f'seo_stage_duration_seconds_sum{{stage="{stage}"}} {entry["sum"]:.6f}')
+                lines.append(f'seo_stage_duration_seconds_count{{stage="{stage}"}} {entry["count"]}')
+            peaks = [(stage, entry["peak_bytes"]) for stage, entry in stages if entry["peak_bytes"] is not None]
+        if peaks:
+            lines.append("# HELP seo_stage_peak_memory_bytes Largest traced allocation peak seen in each stage.")
+            lines.append("# TYPE seo_stage_peak_memory_bytes gauge")
+            lines.extend(f'seo_stage_peak_memory_bytes{{stage="{stage}"}} {peak}' for stage, peak in peaks)
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Atomically write :meth:`prometheus_text` to ``path`` (for a textfile collector)."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".prom.tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp, path)
+
+    def clear(self):
+        with self._lock:
+            self._stages.clear()
+            self.runs = 0
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,302 @@
+"""Keyword relationship graph with a precomputed top-k neighbor index.
+
+Built offline from a keyword corpus, where two keywords are related when they
+share (IDF-weighted) tokens or co-occur in a row's ``related`` list::
+
+    python -m seo_studio.keyword_graph build keywords.csv graph/ --k 20
+    SEO_KEYWORD_GRAPH=graph/ streamlit run app.py
+
+The index is a directory of ``.npy`` arrays (int32 neighbor ids, float16
+weights, token postings) plus ``vocab.txt``. The arrays are memory-mapped, so
+a lookup is a dict hit and one row slice. Keywords outside the corpus are
+matched through the token postings.
+"""
+import argparse
+import json
+import os
+import re
+import threading
+from collections import Counter
+
+import numpy as np
+
+from .keyword_store import _split_related, iter_rows, normalize
+
+WORD_RE = re.compile(r"\w+")
+
+ARRAYS = ("neighbors", "weights", "idf", "norms", "token_indptr", "token_postings")
+
+
+def _tokens(keyword):
+    return set(WORD_RE.findall(keyword))
+
+
+def build_graph(rows, out_dir, k=20, max_df=5000, cooccurrence_weight=0.5):
+    """Build the neighbor index for ``rows`` into ``out_dir``; return the keyword count.
+
+    ``rows`` are keyword strings or dicts with ``keyword`` and optional
+    ``related``. Tokens in more than ``max_df`` keywords are too common to link
+    keywords and are skipped when scoring; a co-occurrence adds
+    ``cooccurrence_weight`` to the pair's cosine similarity.
+    """
+    vocab = {}
+    keywords = []
+
+    def intern(keyword):
+        keyword_id = vocab.get(keyword)
+        if keyword_id is None:
+            keyword_id = vocab[keyword] = len(keywords)
+            keywords.append(keyword)
+        return keyword_id
+
+    pairs = []
+    for row in rows:
+        if isinstance(row, str):
+            row = {"keyword": row}
+        keyword = normalize(row.get("keyword") or "")
+        if not keyword:
+            continue
+        keyword_id = intern(keyword)
+        for term in _split_related(row.get("related")):
+            term = normalize(term)
+            if term and term != keyword:
+                pairs.append((keyword_id, intern(term)))
+    count = len(keywords)
+
+    # Token postings: for each token, the keywords containing it
+    token_ids = {}
+    doc_ids, tok_ids = [], []
+    for keyword_id, keyword in enumerate(keywords):
+        for token in _tokens(keyword):
+            doc_ids.append(keyword_id)
+            tok_ids.append(token_ids.setdefault(token, len(token_ids)))
+    doc_ids = np.array(doc_ids, dtype=np.int32)
+    tok_ids = np.array(tok_ids, dtype=np.int32)
+    df = np.bincount(tok_ids, minlength=len(token_ids))
+    idf = (np.log((1 + count) / (1 + df)) + 1).astype(np.float32)
+    order = np.argsort(tok_ids, kind="stable")
+    postings = doc_ids[order]
+    indptr = np.zeros(len(token_ids) + 1, dtype=np.int64)
+    np.cumsum(df, out=indptr[1:])
+    norms = np.sqrt(np.bincount(doc_ids, weights=idf[tok_ids] ** 2, minlength=count)).astype(np.float32)
+
+    # Keyword -> token lists, from the same pairs sorted by keyword
+    by_doc = np.argsort(doc_ids, kind="stable")
+    doc_tokens = tok_ids[by_doc]
+    doc_indptr = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(doc_ids, minlength=count), out=doc_indptr[1:])
+
+    # Symmetric co-occurrence adjacency
+    cooc = {}
+    for a, b in pairs:
+        cooc.setdefault(a, Counter())[b] += 1
+        cooc.setdefault(b, Counter())[a] += 1
+
+    neighbors = np.full((count, k), -1, dtype=np.int32)
+    weights = np.zeros((count, k), dtype=np.float16)
+    for keyword_id in range(count):
+        candidates, scores = _token_scores(doc_tokens[doc_indptr[keyword_id]:doc_indptr[keyword_id + 1]],
+                                           norms[keyword_id], idf, indptr, postings, norms, max_df)
+        linked = cooc.get(keyword_id)
+        if linked:
+            extra = np.fromiter(linked, dtype=np.int64, count=len(linked))
+            boost = cooccurrence_weight * np.fromiter(linked.values(), dtype=np.float64, count=len(linked))
+            candidates = np.concatenate([candidates, extra])
+            scores = np.concatenate([scores, boost])
+            candidates, inverse = np.unique(candidates, return_inverse=True)
+            scores = np.bincount(inverse, weights=scores)
+        keep = candidates != keyword_id
+        candidates, scores = candidates[keep], scores[keep]
+        if not len(candidates):
+            continue
+        top = _top(scores, k)
+        neighbors[keyword_id, :len(top)] = candidates[top]
+        weights[keyword_id, :len(top)] = np.minimum(scores[top], 65000)
+
+    os.makedirs(out_dir, exist_ok=True)
+    arrays = {"neighbors": neighbors, "weights": weights, "idf": idf, "norms": norms,
+              "token_indptr": indptr, "token_postings": postings}
+    for name, array in arrays.items():
+        np.save(os.path.join(out_dir, f"{name}.npy"), array)
+    with open(os.path.join(out_dir, "vocab.txt"), "w", encoding="utf-8") as f:
+        f.write("\n".join(keywords) + "\n")
+    with open(os.path.join(out_dir, "tokens.txt"), "w", encoding="utf-8") as f:
+        f.write("\n".join(token_ids) + "\n")
+    with open(os.path.join(out_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"keywords": count, "tokens": len(token_ids), "k": k, "max_df": max_df,
+                   "cooccurrence_weight": cooccurrence_weight}, f)
+    return count
+
+
+def _token_scores(query_tokens, query_norm, idf, indptr, postings, norms, max_df):
+    """Cosine similarity between the query tokens and every keyword sharing one."""
+    parts, part_weights = [], []
+    for token in query_tokens:
+        start, end = indptr[token], indptr[token + 1]
+        if end - start > max_df:
+            continue
+        parts.append(postings[start:end])
+        part_weights.append(np.full(end - start, float(idf[token]) ** 2))
+    if not parts:
+        return np.zeros(0, dtype=np.int64), np.zeros(0)
+    candidates, inverse = np.unique(np.concatenate(parts), return_inverse=True)
+    scores = np.bincount(inverse, weights=np.concatenate(part_weights))
+    return candidates.astype(np.int64), scores / (query_norm * norms[candidates])
+
+
+def _top(scores, k):
+    if len(scores) > k:
+        top = np.argpartition(-scores, k - 1)[:k]
+    else:
+        top = np.arange(len(scores))
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+class KeywordGraph:
+    """Read-only view over an index built by :func:`build_graph`; safe to share between threads."""
+
+    def __init__(self, path):
+        if not os.path.exists(os.path.join(path, "vocab.txt")):
+            raise FileNotFoundError(path)
+        self.path = path
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        for name in ARRAYS:
+            setattr(self, "_" + name, np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r"))
+        with open(os.path.join(path, "vocab.txt"), encoding="utf-8") as f:
+            self.keywords = f.read().split("\n")[:self.meta["keywords"]]
+        with open(os.path.join(path, "tokens.txt"), encoding="utf-8") as f:
+            self.token_ids = {token: i for i, token in enumerate(f.read().split("\n")[:self.meta["tokens"]])}
+        self.ids = {keyword: i for i, keyword in enumerate(self.keywords)}
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def __contains__(self, keyword):
+        return normalize(keyword) in self.ids
+
+    def neighbors(self, keyword, k=10):
+        """Return up to ``k`` ``(term, weight)`` pairs, strongest first."""
+        keyword = normalize(keyword)
+        keyword_id = self.ids.get(keyword)
+        if keyword_id is None:
+            return self.similar(keyword, k)
+        row = self._neighbors[keyword_id, :k]
+        row_weights = self._weights[keyword_id, :k]
+        return [(self.keywords[n], float(w)) for n, w in zip(row.tolist(), row_weights.tolist()) if n >= 0]
+
+    def similar(self, keyword, k=10):
+        """Rank corpus keywords by shared tokens with a keyword that is not in the corpus."""
+        tokens = [self.token_ids[t] for t in _tokens(normalize(keyword)) if t in self.token_ids]
+        if not tokens:
+            return []
+        query_norm = float(np.sqrt(np.sum(np.asarray(self._idf)[tokens] ** 2)))
+        candidates, scores = _token_scores(tokens, query_norm, self._idf, self._token_indptr,
+                                           self._token_postings, self._norms, self.meta["max_df"])
+        keyword = normalize(keyword)
+        top = _top(scores, k + 1)
+        return [(self.keywords[candidates[i]], round(float(scores[i]), 4)) for i in top
+                if self.keywords[candidates[i]] != keyword][:k]
+
+    def related(self, keyword, limit=10):
+        return [term for term, _ in self.neighbors(keyword, limit)]
+
+    def expand(self, keyword, depth=2, limit=50, per_node=10, decay=0.5):
+        """Return ``(term, score)`` pairs reachable within ``depth`` hops, best first.
+
+        A term's score is the product of edge weights along its best path,
+        times ``decay`` for each hop after the first.
+        """
+        seed = normalize(keyword)
+        best = {seed: 1.0}
+        frontier = [(seed, 1.0)]
+        for hop in range(depth):
+            factor = decay ** hop
+            next_frontier = []
+            for term, score in frontier:
+                for neighbor, weight in self.neighbors(term, per_node):
+                    value = score * weight * factor
+                    if value > best.get(neighbor, 0.0):
+                        best[neighbor] = value
+                        next_frontier.append((neighbor, value))
+            frontier = next_frontier
+        del best[seed]
+        return sorted(best.items(), key=lambda item: -item[1])[:limit]
+
+
+_default_graph = None
+_default_lock = threading.Lock()
+
+
+def default_graph():
+    """Return the graph at ``SEO_KEYWORD_GRAPH``, or ``None`` if it is unset or missing."""
+    global _default_graph
+    path = os.environ.get("SEO_KEYWORD_GRAPH")
+    if not path or not os.path.exists(os.path.join(path, "vocab.txt")):
+        return None
+    with _default_lock:
+        if _default_graph is None or _default_graph.path != path:
+            _default_graph = KeywordGraph(path)
+        return _default_graph
+
+
+def expand_related(keyword, related, limit=None, graph=None):
+    """Return ``related`` extended with graph neighbors of ``keyword``, up to ``limit`` terms.
+
+    Without a graph (none given and ``SEO_KEYWORD_GRAPH`` unset) ``related`` is
+    returned unchanged.
+    """
+    graph = graph if graph is not None else default_graph()
+    related = list(related)
+    if graph is None:
+        return related
+    limit = limit or max(len(related), 10)
+    seen = {normalize(term) for term in related}
+    seen.add(normalize(keyword))
+    for term in graph.related(keyword, limit):
+        if len(related) >= limit:
+            break
+        if term not in seen:
+            seen.add(term)
+            related.append(term)
+    return related
+
+
+def _read_corpus(path):
+    if path.lower().endswith((".csv", ".parquet", ".pq")):
+        return iter_rows(path)
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or query the keyword neighbor graph.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="build the index from CSV/Parquet or a text file")
+    build.add_argument("input")
+    build.add_argument("out_dir")
+    build.add_argument("--k", type=int, default=20, help="neighbors stored per keyword")
+    build.add_argument("--max-df", type=int, default=5000, help="skip tokens shared by more keywords than this")
+    build.add_argument("--cooccurrence-weight", type=float, default=0.5)
+    related = sub.add_parser("related", help="show a keyword's neighbors")
+    related.add_argument("graph")
+    related.add_argument("keyword")
+    related.add_argument("--depth", type=int, default=1)
+    related.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        count = build_graph(_read_corpus(args.input), args.out_dir, args.k, args.max_df, args.cooccurrence_weight)
+        print(f"Indexed {count} keywords into {args.out_dir}")
+    else:
+        graph = KeywordGraph(args.graph)
+        if args.depth > 1:
+            results = graph.expand(args.keyword, depth=args.depth, limit=args.limit)
+        else:
+            results = graph.neighbors(args.keyword, args.limit)
+        for term, weight in results:
+            print(f"{weight:.3f}\t{term}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""Disk-backed keyword index (SQLite) for exact lookup, prefix search and related terms.
+
+Build once from CSV or Parquet, then open read-only from any number of
+sessions or processes::
+
+    python -m seo_studio.keyword_store build keywords.csv keywords.db
+    SEO_KEYWORD_DB=keywords.db streamlit run app.py
+
+Input columns: ``keyword, volume, difficulty, cpc, trend, related`` where
+``related`` is a ``|`` or ``;`` separated list.
+"""
+import argparse
+import csv
+import os
+import re
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS keywords (
+    id INTEGER PRIMARY KEY,
+    keyword TEXT NOT NULL UNIQUE,
+    volume INTEGER,
+    difficulty INTEGER,
+    cpc REAL,
+    trend TEXT
+);
+CREATE TABLE IF NOT EXISTS related (
+    keyword_id INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    term TEXT NOT NULL,
+    PRIMARY KEY (keyword_id, rank)
+) WITHOUT ROWID;
+"""
+
+BATCH_SIZE = 10000
+
+
+def normalize(keyword):
+    return " ".join(keyword.lower().split())
+
+
+def _split_related(value):
+    if not value:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(v).strip() for v in value if str(v).strip()]
+    return [term.strip() for term in re.split(r"[|;]", str(value)) if term.strip()]
+
+
+def _iter_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def _iter_parquet(path):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Building from Parquet requires pyarrow (pip install pyarrow)") from e
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=BATCH_SIZE):
+        yield from batch.to_pylist()
+
+
+def iter_rows(path):
+    """Yield row dicts from a CSV or Parquet file."""
+    if path.lower().endswith((".parquet", ".pq")):
+        return _iter_parquet(path)
+    return _iter_csv(path)
+
+
+def build_store(rows, db_path):
+    """Load ``rows`` (dicts with the input columns) into ``db_path``; return the row count."""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(SCHEMA)
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        count = 0
+        # Related terms per keyword in the current batch; a later row for the same keyword wins
+        keyword_batch, related_batch = [], {}
+
+        def flush():
+            conn.executemany(
+                "INSERT INTO keywords (keyword, volume, difficulty, cpc, trend) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(keyword) DO UPDATE SET volume=excluded.volume, difficulty=excluded.difficulty, "
+                "cpc=excluded.cpc, trend=excluded.trend",
+                keyword_batch)
+            # Replace the whole list, so a rebuild with fewer related terms leaves no stale ranks behind
+            conn.executemany(
+                "DELETE FROM related WHERE keyword_id = (SELECT id FROM keywords WHERE keyword = ?)",
+                [(keyword,) for keyword in related_batch])
+            conn.executemany(
+                "INSERT INTO related (keyword_id, rank, term) "
+                "VALUES ((SELECT id FROM keywords WHERE keyword = ?), ?, ?)",
+                [(keyword, rank, term) for keyword, terms in related_batch.items()
+                 for rank, term in enumerate(terms)])
+            keyword_batch.clear()
+            related_batch.clear()
+
+        for row in rows:
+            keyword = normalize(row.get("keyword") or "")
+            if not keyword:
+                continue
+            keyword_batch.append((
+                keyword,
+                int(float(row.get("volume") or 0)),
+                int(float(row.get("difficulty") or 0)),
+                float(row.get("cpc") or 0.0),
+                (row.get("trend") or "stable").strip().lower(),
+            ))
+            related_batch[keyword] = _split_related(row.get("related"))
+            count += 1
+            if len(keyword_batch) >= BATCH_SIZE:
+                flush()
+        flush()
+        conn.commit()
+        conn.execute("ANALYZE")
+        return count
+    finally:
+        conn.close()
+
+
+class KeywordStore:
+    """Read-only view over a keyword database built by :func:`build_store`.
+
+    Each thread (and each process after a fork) gets its own connection, so one
+    store can be shared by every Streamlit session in the server.
+    """
+
+    def __init__(self, db_path):
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(db_path)
+        self.db_path = db_path
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM keywords").fetchone()[0]
+
+    def related(self, keyword, limit=20):
+        rows = self._connection().execute(
+            "SELECT r.term FROM keywords k JOIN related r ON r.keyword_id = k.id "
+            "WHERE k.keyword = ? ORDER BY r.rank LIMIT ?",
+            (normalize(keyword), limit)).fetchall()
+        return [term for (term,) in rows]
+
+    def lookup(self, keyword):
+        """Return the metrics dict for ``keyword``, or ``None`` if it is not indexed."""
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT id, volume, difficulty, cpc, trend FROM keywords WHERE keyword = ?",
+            (normalize(keyword),)).fetchone()
+        if row is None:
+            return None
+        keyword_id, volume, difficulty, cpc, trend = row
+        related = [term for (term,) in conn.execute(
+            "SELECT term FROM related WHERE keyword_id = ? ORDER BY rank", (keyword_id,))]
+        return {
+            "volume": volume,
+            "difficulty": difficulty,
+            "cpc": cpc,
+            "trend": trend,
+            "related": related,
+        }
+
+    def prefix_search(self, prefix, limit=10):
+        """Return up to ``limit`` indexed keywords starting with ``prefix``, highest volume first."""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        # Range scan on the keyword index; only a bounded window is ranked by volume
+        rows = self._connection().execute(
+            "SELECT keyword, volume FROM keywords WHERE keyword >= ? AND keyword < ? "
+            "ORDER BY keyword LIMIT ?",
+            (prefix, prefix + "\uffff", limit * 10)).fetchall()
+        rows.sort(key=lambda row: -(row[1] or 0))
+        return [keyword for keyword, _ in rows[:limit]]
+
+
+_default_store = None
+_default_lock = threading.Lock()
+
+
+def default_store():
+    """Return the store named by ``SEO_KEYWORD_DB``, or ``None`` if it is unset or missing."""
+    global _default_store
+    path = os.environ.get("SEO_KEYWORD_DB")
+    if not path or not os.path.exists(path):
+        return None
+    with _default_lock:
+        if _default_store is None or _default_store.db_path != path:
+            _default_store = KeywordStore(path)
+        return _default_store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or query the keyword index.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="build an index from CSV/Parquet")
+    build.add_argument("input")
+    build.add_argument("db")
+    lookup = sub.add_parser("lookup", help="look up one keyword")
+    lookup.add_argument("db")
+    lookup.add_argument("keyword")
+    prefix = sub.add_parser("prefix", help="autocomplete a prefix")
+    prefix.add_argument("db")
+    prefix.add_argument("prefix")
+    prefix.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        count = build_store(iter_rows(args.input), args.db)
+        print(f"Indexed {count} keywords into {args.db}")
+    elif args.command == "lookup":
+        print(KeywordStore(args.db).lookup(args.keyword))
+    else:
+        for keyword in KeywordStore(args.db).prefix_search(args.prefix, args.limit):
+            print(keyword)
+
+
+if __name__ == "__main__":
+    main()
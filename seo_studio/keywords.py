@@ -0,0 +1,110 @@
+"""Keyword lookup and mock keyword metrics."""
+import hashlib
+import os
+import random
+from functools import lru_cache
+
+# Sample keyword database (in real app, you'd use API)
+KEYWORD_DATABASE = {
+    "digital marketing": {
+        "volume": 74000,
+        "difficulty": 72,
+        "cpc": 12.45,
+        "trend": "increasing",
+        "related": ["social media marketing", "content marketing", "seo", "email marketing", "ppc", "inbound marketing", "affiliate marketing"]
+    },
+    "python tutorial": {
+        "volume": 135000,
+        "difficulty": 45,
+        "cpc": 1.23,
+        "trend": "stable",
+        "related": ["python for beginners", "django tutorial", "machine learning python", "data analysis python", "web scraping python"]
+    },
+    "healthy recipes": {
+        "volume": 246000,
+        "difficulty": 68,
+        "cpc": 2.15,
+        "trend": "increasing",
+        "related": ["easy recipes", "keto recipes", "vegetarian recipes", "meal prep", "healthy breakfast", "low carb recipes"]
+    }
+}
+
+
+def _resolve_seed(seed):
+    return os.environ.get("SEO_MOCK_SEED", "") if seed is None else str(seed)
+
+
+def keyword_rng(keyword, seed=None, salt=""):
+    """Return a ``random.Random`` seeded from the normalized keyword.
+
+    ``seed`` defaults to ``SEO_MOCK_SEED``; ``salt`` separates independent
+    streams (e.g. metrics vs. generated text) for the same keyword.
+    """
+    from .keyword_store import normalize
+
+    seed = _resolve_seed(seed)
+    digest = hashlib.blake2b(f"{seed}:{salt}:{normalize(keyword)}".encode("utf-8"), digest_size=8).digest()
+    return random.Random(int.from_bytes(digest, "big"))
+
+
+@lru_cache(maxsize=4096)
+def _mock_keyword_data(keyword, seed):
+    rng = keyword_rng(keyword, seed, "metrics")
+    return {
+        "volume": rng.randint(10000, 250000),
+        "difficulty": rng.randint(30, 90),
+        "cpc": round(rng.uniform(0.5, 20.0), 2),
+        "trend": rng.choice(["increasing", "decreasing", "stable"]),
+        "related": (
+            f"{keyword} for beginners",
+            f"best {keyword}",
+            f"{keyword} strategies",
+            f"{keyword} tips",
+            f"advanced {keyword}"
+        )
+    }
+
+
+def mock_keyword_data(keyword, seed=None):
+    """Return mock metrics for ``keyword``; the same keyword and seed always give the same data."""
+    data = dict(_mock_keyword_data(keyword, _resolve_seed(seed)))
+    data["related"] = list(data["related"])
+    return data
+
+
+@lru_cache(maxsize=4096)
+def _competition_scores(keyword, seed):
+    rng = keyword_rng(keyword, seed, "competition")
+    return rng.randint(40, 90), rng.randint(30, 85)
+
+
+def competition_scores(keyword, seed=None):
+    """Return the ``(competition, opportunity)`` scores shown on the radar chart."""
+    from .keyword_store import normalize
+
+    return _competition_scores(normalize(keyword), _resolve_seed(seed))
+
+
+def get_keyword_data(keyword, seed=None, store=None):
+    """Return metrics for ``keyword``, generating mock data for unknown keywords.
+
+    The keyword index (``store``, or the one named by ``SEO_KEYWORD_DB``) is
+    consulted first, then the built-in sample database.
+    """
+    # Imported here so the package can load without ``keyword_store``, letting
+    # ``python -m seo_studio.keyword_store`` run it as a fresh module
+    from .keyword_store import default_store
+
+    if store is None:
+        store = default_store()
+    if store is not None:
+        keyword_data = store.lookup(keyword)
+        if keyword_data is not None:
+            return keyword_data
+
+    if keyword.lower() in KEYWORD_DATABASE:
+        return KEYWORD_DATABASE[keyword.lower()]
+
+    # Generate mock data for new keywords
+    return mock_keyword_data(keyword, seed)
+
@@ -0,0 +1,45 @@
+"""Stage-based progress reporting with per-stage timing."""
+import time
+from contextlib import contextmanager, nullcontext
+
+GENERATION_STAGES = ["structure", "paragraphs", "readability", "density", "charts"]
+
+
+class StageProgress:
+    """Track progress through a fixed list of named stages.
+
+    ``callback(fraction, label)`` is called when each stage starts and when it
+    finishes, so a progress bar can show what is currently running. With a
+    ``profile`` (:class:`~seo_studio.instrumentation.RunProfile`) each stage is
+    also recorded there.
+    """
+
+    def __init__(self, stages=GENERATION_STAGES, callback=None, profile=None):
+        self.stages = list(stages)
+        self.callback = callback
+        self.profile = profile
+        self.timings = {}
+
+    @contextmanager
+    def stage(self, name):
+        done = len(self.timings)
+        if self.callback:
+            self.callback(done / len(self.stages), f"{name.title()}...")
+        section = self.profile.section(name) if self.profile is not None else nullcontext()
+        start = time.perf_counter()
+        try:
+            with section:
+                yield
+        finally:
+            self.timings[name] = time.perf_counter() - start
+            if self.callback:
+                self.callback(min(1.0, (done + 1) / len(self.stages)), f"{name.title()} done")
+
+    @property
+    def total(self):
+        return sum(self.timings.values())
+
+    def summary(self):
+        """Return a one-line ``stage: ms`` summary of the recorded timings."""
+        parts = [f"{name} {seconds * 1000:.1f} ms" for name, seconds in self.timings.items()]
+        return " • ".join(parts + [f"total {self.total * 1000:.1f} ms"])
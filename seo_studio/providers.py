@@ -0,0 +1,521 @@
+"""Pluggable keyword-data providers behind a batching, coalescing asyncio client.
+
+A provider answers ``fetch(keywords)`` with ``{keyword: data}`` for a whole
+batch. :class:`KeywordClient` sits in front of one and adds:
+
+- a TTL response cache, optionally backed by a cross-process
+  :class:`~seo_studio.shared_cache.SharedCache` (``SEO_SHARED_CACHE``),
+- coalescing, so concurrent lookups of the same keyword share one request,
+- micro-batching, so lookups arriving within a few milliseconds go out together,
+- a concurrency cap and a token-bucket rate limit,
+- retries with exponential backoff (in :class:`HTTPProvider`).
+
+:class:`HTTPProvider` speaks JSON over a pool of keep-alive HTTP/1.1
+connections using only the standard library; ``python -m seo_studio.stub_server``
+serves the same API from mock data for offline use. Set ``SEO_PROVIDER_URL`` to
+make the dashboard and batch jobs use a provider.
+"""
+import asyncio
+import json
+import logging
+import os
+import random
+import ssl
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from .keyword_store import normalize
+from .keywords import get_keyword_data
+from .shared_cache import default_shared_cache
+
+logger = logging.getLogger("seo_studio")
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def parse_retry_after(value, default=None):
+    """Seconds to wait from a ``Retry-After`` header (delay seconds or an HTTP date)."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
+class ProviderError(Exception):
+    """A provider request failed (after any retries)."""
+
+    def __init__(self, message, status=None, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+# ---------------- PROVIDERS ----------------
+class KeywordProvider:
+    """Base class: ``fetch`` returns ``{keyword: data}`` for a batch of keywords.
+
+    ``data`` has the same shape as :func:`seo_studio.keywords.get_keyword_data`
+    (volume, difficulty, cpc, trend, related). Keywords missing from the result
+    are reported to the caller as errors.
+    """
+
+    max_batch = 100
+
+    async def fetch(self, keywords):
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+
+class LocalProvider(KeywordProvider):
+    """The keyword index, sample database and mock data, served off the event loop."""
+
+    def __init__(self, seed=None, store=None):
+        self.seed = seed
+        self.store = store
+
+    async def fetch(self, keywords):
+        return await asyncio.to_thread(
+            lambda: {kw: get_keyword_data(kw, seed=self.seed, store=self.store) for kw in keywords})
+
+
+def _parse_int(parts, what, raw=None, base=10):
+    """Parse the single value in ``parts`` as a non-negative int, or raise :class:`ProviderError`."""
+    try:
+        value = int(parts[0], base)
+    except (IndexError, ValueError):
+        value = -1
+    if value < 0:
+        raise ProviderError(f"keyword provider sent a malformed {what}: {(raw or parts)!r}")
+    return value
+
+
+class ConnectionPool:
+    """Keep-alive HTTP/1.1 connections to one host, at most ``size`` open at once."""
+
+    def __init__(self, host, port, use_ssl=False, size=8, timeout=10.0):
+        self.host = host
+        self.port = port
+        self.ssl = ssl.create_default_context() if use_ssl else None
+        self.size = size
+        self.timeout = timeout
+        self._idle = []
+        self._slots = None
+        self.opened = 0
+
+    async def request(self, method, path, body=b"", headers=None):
+        """Send one request and return ``(status, headers, body)``."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        async with self._slots:
+            while self._idle:
+                conn = self._idle.pop()
+                try:
+                    return await self._roundtrip(conn, method, path, body, headers)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    # The server closed an idle connection; try the next one
+                    continue
+            conn = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port, ssl=self.ssl), self.timeout)
+            self.opened += 1
+            return await self._roundtrip(conn, method, path, body, headers)
+
+    async def _roundtrip(self, conn, method, path, body, headers):
+        reader, writer = conn
+        try:
+            result, keep_alive = await asyncio.wait_for(
+                self._exchange(reader, writer, method, path, body, headers), self.timeout)
+        except BaseException:
+            writer.close()
+            raise
+        if keep_alive:
+            self._idle.append(conn)
+        else:
+            writer.close()
+        return result
+
+    async def _exchange(self, reader, writer, method, path, body, headers):
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}", f"Content-Length: {len(body)}",
+                 "Connection: keep-alive"]
+        lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by server")
+        status = _parse_int(status_line.split()[1:2], "status line", status_line)
+        response_headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        keep_alive = response_headers.get("connection", "").lower() != "close"
+        if "content-length" in response_headers:
+            raw = response_headers["content-length"]
+            length = _parse_int([raw], "Content-Length", raw)
+            data = await reader.readexactly(length)
+        elif response_headers.get("transfer-encoding", "").lower() == "chunked":
+            parts = []
+            while True:
+                line = await reader.readline()
+                size = _parse_int([line.split(b";")[0]], "chunk size", line, base=16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                parts.append(await reader.readexactly(size))
+                await reader.readline()
+            data = b"".join(parts)
+        else:
+            data = await reader.read()
+            keep_alive = False
+        return (status, response_headers, data), keep_alive
+
+    async def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+
+class HTTPProvider(KeywordProvider):
+    """JSON keyword API: ``POST {base_url}/keywords {"keywords": [...]}`` -> ``{"results": {...}}``.
+
+    Connection errors, timeouts, 429 and 5xx responses are retried up to
+    ``retries`` times with jittered exponential backoff (or the server's
+    ``Retry-After``).
+    """
+
+    def __init__(self, base_url, api_key=None, pool_size=8, timeout=10.0, retries=3, backoff=0.2,
+                 max_batch=100):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported provider URL: {base_url}")
+        use_ssl = parts.scheme == "https"
+        self.path = parts.path.rstrip("/") + "/keywords"
+        self.pool = ConnectionPool(parts.hostname, parts.port or (443 if use_ssl else 80), use_ssl,
+                                   size=pool_size, timeout=timeout)
+        self.headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
+        self.retries = retries
+        self.backoff = backoff
+        self.max_batch = max_batch
+        self.requests = 0
+        self.retried = 0
+
+    async def fetch(self, keywords):
+        body = json.dumps({"keywords": list(keywords)}).encode("utf-8")
+        for attempt in range(self.retries + 1):
+            try:
+                return await self._post(body)
+            except (ProviderError, OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                retryable = not isinstance(e, ProviderError) or e.status in RETRY_STATUSES
+                if not retryable or attempt == self.retries:
+                    if isinstance(e, ProviderError):
+                        raise
+                    raise ProviderError(f"keyword provider unreachable: {e!r}") from e
+                delay = getattr(e, "retry_after", None) or self.backoff * 2 ** attempt * (0.5 + random.random())
+                self.retried += 1
+                logger.debug("provider request failed (%r), retrying in %.2fs", e, delay)
+                await asyncio.sleep(delay)
+
+    async def _post(self, body):
+        self.requests += 1
+        status, headers, data = await self.pool.request("POST", self.path, body, self.headers)
+        if status != 200:
+            raise ProviderError(f"keyword provider returned HTTP {status}", status,
+                                parse_retry_after(headers.get("retry-after")))
+        try:
+            results = json.loads(data)["results"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise ProviderError(f"keyword provider sent an invalid response: {e!r}", status) from e
+        if not isinstance(results, dict) or not all(isinstance(v, dict) for v in results.values()):
+            raise ProviderError("keyword provider sent an invalid response: results is not a keyword map", status)
+        return results
+
+    async def close(self):
+        await self.pool.close()
+
+
+# ---------------- CLIENT ----------------
+class RateLimiter:
+    """Token bucket allowing ``rate`` requests per second with bursts of ``burst``."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = None
+
+    async def acquire(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class _TTLCache:
+    def __init__(self, ttl, max_items):
+        self.ttl = ttl
+        self.max_items = max_items
+        self._items = OrderedDict()
+
+    def get(self, key):
+        item = self._items.get(key)
+        if item is None:
+            return None
+        expires, value = item
+        if expires < time.monotonic():
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._items[key] = (time.monotonic() + self.ttl, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+
+
+class KeywordClient:
+    """Cached, coalescing, micro-batching front end for a :class:`KeywordProvider`.
+
+    Use ``await get(...)`` / ``await get_many(...)`` from a single event loop, or
+    the blocking ``lookup`` / ``lookup_many`` from ordinary threads, which run
+    on the client's own background loop. Don't mix the two on one client.
+    With a ``shared`` cache, responses are also reused across processes.
+    """
+
+    SHARED_NAMESPACE = "keyword_data"
+
+    def __init__(self, provider, batch_size=None, batch_window=0.005, max_concurrency=4, rate=None,
+                 cache_ttl=3600, cache_size=10000, shared=None):
+        self.provider = provider
+        self.shared = shared
+        self.batch_size = batch_size or provider.max_batch
+        self.batch_window = batch_window
+        self.max_concurrency = max_concurrency
+        self.limiter = RateLimiter(rate) if rate else None
+        self.cache = _TTLCache(cache_ttl, cache_size)
+        self._inflight = {}
+        self._pending = []
+        self._flush_handle = None
+        self._slots = None
+        self._loop = None
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self.hits = 0
+        self.coalesced = 0
+        self.batches = 0
+
+    # ---------------- ASYNC API ----------------
+    async def get(self, keyword):
+        """Return metrics for ``keyword``, sharing work with concurrent lookups."""
+        key = normalize(keyword)
+        data = self.cache.get(key)
+        if data is not None:
+            self.hits += 1
+            return _copy(data)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            self._enqueue(key)
+        else:
+            self.coalesced += 1
+        return _copy(await asyncio.shield(future))
+
+    async def get_many(self, keywords):
+        """Return ``{keyword: data}`` for ``keywords``, fetched in as few batches as possible."""
+        keywords = list(keywords)
+        results = await asyncio.gather(*(self.get(kw) for kw in keywords))
+        return dict(zip(keywords, results))
+
+    def _enqueue(self, key):
+        self._pending.append(key)
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.batch_window, self._flush)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        while self._pending:
+            batch, self._pending = self._pending[:self.batch_size], self._pending[self.batch_size:]
+            asyncio.get_running_loop().create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        keys, error = batch, None
+        try:
+            batch = await self._from_shared(batch)
+            if not batch:
+                return
+            async with self._slots:
+                if self.limiter is not None:
+                    await self.limiter.acquire()
+                self.batches += 1
+                results = await self.provider.fetch(batch)
+            results = {normalize(kw): data for kw, data in results.items()}
+            for key in batch:
+                data = results.get(key)
+                if data is not None:
+                    self.cache.put(key, data)
+                    self._resolve(key, data)
+            await self._to_shared([(key, results[key]) for key in batch if key in results])
+        except asyncio.CancelledError:
+            error = ProviderError("keyword lookup cancelled")
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            # Every waiter gets an answer (and leaves _inflight), even if this task failed
+            for key in keys:
+                self._resolve(key, error=error or ProviderError(f"no data returned for {key!r}"))
+
+    async def _from_shared(self, batch):
+        """Resolve the keys found in the shared cache; return the rest. A failing cache counts as a miss."""
+        if self.shared is None:
+            return batch
+        try:
+            shared = await asyncio.to_thread(self.shared.get_many, self.SHARED_NAMESPACE, batch)
+        except Exception as e:
+            logger.warning("shared cache read failed (%r); fetching from the provider", e)
+            return batch
+        for key, data in shared.items():
+            self.cache.put(key, data)
+            self._resolve(key, data)
+        return [key for key in batch if key not in shared]
+
+    async def _to_shared(self, items):
+        if self.shared is None or not items:
+            return
+        try:
+            await asyncio.to_thread(self.shared.put_many, self.SHARED_NAMESPACE, items)
+        except Exception as e:
+            logger.warning("shared cache write failed (%r); results are only cached locally", e)
+
+    def _resolve(self, key, data=None, error=None):
+        future = self._inflight.pop(key, None)
+        if future is None or future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(data)
+
+    async def aclose(self):
+        await self.provider.close()
+
+    # ---------------- BLOCKING API ----------------
+    def _run(self, coro, timeout):
+        with self._thread_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="seo-providers", daemon=True)
+                self._thread.start()
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def lookup(self, keyword, timeout=None):
+        """Blocking :meth:`get`; raises ``TimeoutError`` after ``timeout`` seconds."""
+        return self._run(self.get(keyword), timeout)
+
+    def lookup_many(self, keywords, timeout=None):
+        """Blocking :meth:`get_many`."""
+        return self._run(self.get_many(keywords), timeout)
+
+    def close(self):
+        if self._loop is not None:
+            self._run(self.aclose(), 5)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(5)
+            self._loop = None
+
+
+def _copy(data):
+    data = dict(data)
+    data["related"] = list(data.get("related") or [])
+    return data
+
+
+def provider_from_url(url, **kwargs):
+    """Return the provider for ``url`` (``local`` for the built-in data, else an HTTP API)."""
+    if url in (None, "", "local"):
+        return LocalProvider()
+    return HTTPProvider(url, api_key=os.environ.get("SEO_PROVIDER_KEY"), **kwargs)
+
+
+_default_client = None
+_default_pid = None
+_default_lock = threading.Lock()
+
+
+def default_client():
+    """Return the process-wide client for ``SEO_PROVIDER_URL``, or ``None`` when unset.
+
+    ``SEO_PROVIDER_RATE`` caps requests per second; responses are shared with
+    other processes through ``SEO_SHARED_CACHE`` when it is set.
+    """
+    global _default_client, _default_pid
+    url = os.environ.get("SEO_PROVIDER_URL")
+    if not url:
+        return None
+    with _default_lock:
+        if _default_client is None or _default_pid != os.getpid():
+            rate = os.environ.get("SEO_PROVIDER_RATE")
+            _default_client = KeywordClient(provider_from_url(url), rate=float(rate) if rate else None,
+                                            shared=default_shared_cache())
+            _default_pid = os.getpid()
+        return _default_client
+
+
+def fetch_keyword_data(keyword, timeout=None, client=None):
+    """Return metrics for ``keyword`` from the configured provider.
+
+    Falls back to :func:`get_keyword_data` when no provider is configured, or
+    when it fails or takes longer than ``timeout`` (``SEO_PROVIDER_TIMEOUT``,
+    default 3 seconds), so a slow API never blocks the dashboard.
+    """
+    client = client or default_client()
+    if client is None:
+        return get_keyword_data(keyword)
+    if timeout is None:
+        timeout = float(os.environ.get("SEO_PROVIDER_TIMEOUT", 3))
+    try:
+        return client.lookup(keyword, timeout)
+    except (ProviderError, TimeoutError) as e:
+        logger.warning("keyword provider failed for %r (%r); using local data", keyword, e)
+        return get_keyword_data(keyword)
@@ -0,0 +1,159 @@
+"""Readability scores (Flesch, Flesch-Kincaid, Gunning Fog, SMOG) from one text scan.
+
+All four formulas need only word, sentence, syllable and polysyllable totals,
+which :mod:`seo_studio.textscan` collects in its single pass using the
+memoized :class:`SyllableTable` (prewarmed from ``SEO_SYLLABLE_WORDS`` when
+set). The formulas are written over NumPy arrays, so :func:`score_documents`
+scores a whole corpus at once.
+"""
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+
+_VOWEL_GROUPS = re.compile(r"[aeiouy]+")
+
+# Three or more syllables makes a word "complex" for Gunning Fog and SMOG
+POLYSYLLABLE = 3
+
+# How far from the target readability still counts as on target
+TARGET_TOLERANCE = 5
+
+
+def estimate_syllables(word):
+    """Estimate the syllables in a lowercase ``word`` (at least one)."""
+    count = len(_VOWEL_GROUPS.findall(word))
+    if word.endswith("e") and not word.endswith(("le", "ee")) and count > 1:
+        count -= 1
+    elif word.endswith(("es", "ed")) and count > 1 and not word.endswith(("ted", "ded", "ses", "zes", "ces")):
+        count -= 1
+    return max(1, count)
+
+
+class SyllableTable:
+    """Per-word syllable counts: exact entries first, then a bounded LRU of estimates.
+
+    Prewarm with :meth:`prewarm` (estimates for a word list) or :meth:`load`
+    (a file of ``word`` or ``word syllables`` lines, e.g. exported from a
+    pronunciation dictionary).
+    """
+
+    def __init__(self, maxsize=65536):
+        self.maxsize = maxsize
+        self.exact = {}
+        self._estimate = lru_cache(maxsize=maxsize)(estimate_syllables)
+
+    def count(self, word):
+        exact = self.exact.get(word)
+        return exact if exact is not None else self._estimate(word)
+
+    __call__ = count
+
+    def prewarm(self, words):
+        """Fill the estimate cache for ``words``; return how many were added."""
+        before = self._estimate.cache_info().currsize
+        for word in words:
+            word = word.strip().lower()
+            if word and word not in self.exact:
+                self._estimate(word)
+        return self._estimate.cache_info().currsize - before
+
+    def load(self, path):
+        """Read a word list; lines with a count become exact entries. Returns the line count."""
+        plain = []
+        lines = 0
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if not parts:
+                    continue
+                lines += 1
+                if len(parts) > 1 and parts[1].isdigit():
+                    self.exact[parts[0].lower()] = max(1, int(parts[1]))
+                else:
+                    plain.append(parts[0])
+        self.prewarm(plain)
+        return lines
+
+    def cache_info(self):
+        return self._estimate.cache_info()
+
+    def cache_clear(self):
+        self._estimate.cache_clear()
+
+
+default_table = SyllableTable()
+if os.environ.get("SEO_SYLLABLE_WORDS"):
+    # Only reads a file when explicitly configured
+    default_table.load(os.environ["SEO_SYLLABLE_WORDS"])
+
+
+def count_syllables(word):
+    """Syllables in a lowercase ``word`` from the shared :data:`default_table`."""
+    return default_table.count(word)
+
+
+def syllable_totals(terms, table=default_table):
+    """Return ``(syllables, polysyllables)`` for a ``{term: count}`` mapping."""
+    syllables = polysyllables = 0
+    count = table.count
+    for term, times in terms.items():
+        n = count(term)
+        syllables += n * times
+        if n >= POLYSYLLABLE:
+            polysyllables += times
+    return syllables, polysyllables
+
+
+def score_arrays(words, sentences, syllables, polysyllables):
+    """Compute all four scores for arrays of per-document totals (0 where undefined)."""
+    words = np.asarray(words, dtype=np.float64)
+    sentences = np.asarray(sentences, dtype=np.float64)
+    syllables = np.asarray(syllables, dtype=np.float64)
+    polysyllables = np.asarray(polysyllables, dtype=np.float64)
+    valid = (words > 0) & (sentences > 0)
+    safe_words = np.where(valid, words, 1)
+    safe_sentences = np.where(valid, sentences, 1)
+    words_per_sentence = words / safe_sentences
+    syllables_per_word = syllables / safe_words
+    return {
+        "flesch_reading_ease": np.where(valid, 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word, 0.0),
+        "flesch_kincaid_grade": np.where(valid, 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59, 0.0),
+        "gunning_fog": np.where(valid, 0.4 * (words_per_sentence + 100 * polysyllables / safe_words), 0.0),
+        "smog_index": np.where(valid, 1.043 * np.sqrt(polysyllables * 30 / safe_sentences) + 3.1291, 0.0),
+    }
+
+
+def readability_scores(stats):
+    """Return the four scores (rounded) for scanned ``stats`` from :mod:`textscan`."""
+    scores = score_arrays(stats["words"], stats["sentences"], stats["syllables"], stats["polysyllables"])
+    return {name: round(float(value), 2) for name, value in scores.items()}
+
+
+def compare_to_target(score, target, tolerance=TARGET_TOLERANCE):
+    """Compare a Flesch reading-ease ``score`` with the ``target`` from the sidebar."""
+    gap = round(score - target, 1)
+    if abs(gap) <= tolerance:
+        status, message = "on_target", "On target"
+    elif gap < 0:
+        status, message = "too_hard", "Harder to read than the target: use shorter sentences and simpler words"
+    else:
+        status, message = "too_easy", "Easier than the target: there is room for more detail"
+    return {"score": score, "target": target, "gap": gap, "status": status, "message": message}
+
+
+def score_documents(texts, target=None):
+    """Score a sequence of documents in bulk; return a dict of NumPy arrays.
+
+    Includes the per-document totals and, with ``target``, the gap to it.
+    """
+    from .textscan import scan_text
+
+    totals = np.array([[s["words"], s["sentences"], s["syllables"], s["polysyllables"]]
+                       for s in map(scan_text, texts)], dtype=np.int64).reshape(-1, 4)
+    result = score_arrays(*totals.T)
+    result.update(words=totals[:, 0], sentences=totals[:, 1], syllables=totals[:, 2], polysyllables=totals[:, 3])
+    if target is not None:
+        result["target_gap"] = result["flesch_reading_ease"] - target
+    return result
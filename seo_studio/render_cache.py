@@ -0,0 +1,168 @@
+"""Bounded, content-addressed cache for rendered artifacts (images, figures).
+
+Entries live in an in-process LRU capped by item count and total bytes, with an
+optional on-disk tier so other processes and restarts can reuse renders. The
+disk tier is bounded too: files older than ``disk_max_age`` are deleted, and
+the least recently used files go once the directory outgrows
+``disk_max_bytes``.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+# The disk tier is pruned down to this fraction of its limit, so it isn't rescanned on every write
+DISK_PRUNE_TARGET = 0.8
+# Rescan at least this often (seconds) to account for files written by other processes
+DISK_RESCAN_INTERVAL = 300
+
+
+def cache_key(*parts):
+    """Return a stable hex digest for JSON-serializable ``parts``."""
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    def __init__(self, max_items=256, max_bytes=64 * 1024 * 1024, disk_dir=None,
+                 disk_max_bytes=256 * 1024 * 1024, disk_max_age=7 * 24 * 3600):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.disk_max_age = disk_max_age
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Estimated size of the disk tier; None until it has been scanned
+        self._disk_bytes = None
+        self._disk_scanned = 0.0
+        self._disk_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size_bytes(self):
+        return self._bytes
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, size):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_items or self._bytes > self.max_bytes):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _disk_path(self, key, suffix):
+        return os.path.join(self.disk_dir, key[:2], key + suffix)
+
+    def _disk_read(self, key, suffix):
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key, suffix)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # Mark the file as recently used, so pruning removes it last
+            os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    def _disk_write(self, key, suffix, data):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key, suffix)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            return
+        with self._disk_lock:
+            stale = time.time() - self._disk_scanned > DISK_RESCAN_INTERVAL
+            if self._disk_bytes is not None:
+                self._disk_bytes += len(data)
+            if stale or self._disk_bytes > self.disk_max_bytes:
+                self._disk_prune()
+
+    def _disk_prune(self):
+        """Delete expired files, then the least recently used ones until the tier is under its target size."""
+        now = time.time()
+        files = []
+        for root, _, names in os.walk(self.disk_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    info = os.stat(path)
+                    if self.disk_max_age is not None and now - info.st_mtime > self.disk_max_age:
+                        os.remove(path)
+                        continue
+                except OSError:
+                    continue
+                files.append((info.st_mtime, info.st_size, path))
+        total = sum(size for _, size, _ in files)
+        if total > self.disk_max_bytes:
+            files.sort()
+            for _, size, path in files:
+                if total <= self.disk_max_bytes * DISK_PRUNE_TARGET:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+        self._disk_bytes = total
+        self._disk_scanned = now
+
+    def get_or_render(self, key, render, suffix=".bin", encode=None, decode=None):
+        """Return the cached value for ``key``, calling ``render()`` on a miss.
+
+        ``encode``/``decode`` convert between the value and the bytes stored on
+        disk; they default to the identity, so ``render`` should return bytes.
+        """
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        data = self._disk_read(key, suffix)
+        if data is not None:
+            value = decode(data) if decode else data
+        else:
+            value = render()
+            data = encode(value) if encode else value
+            self._disk_write(key, suffix, data)
+        self.put(key, value, len(data))
+        return value
+
+
+default_cache = RenderCache(disk_dir=os.environ.get("SEO_RENDER_CACHE_DIR") or None,
+                            disk_max_bytes=int(float(os.environ.get("SEO_RENDER_CACHE_MAX_MB", 256)) * 1024 * 1024))
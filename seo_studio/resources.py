@@ -0,0 +1,88 @@
+"""Lazy, process-wide loading of heavy modules and NLTK corpora.
+
+Nothing here runs at import time: modules and corpora are loaded the first time
+a section needs them and then shared by every session in the process.
+
+``SEO_NLTK_DATA`` points NLTK at a local directory of bundled corpora, and
+``SEO_OFFLINE=1`` disables downloads entirely.
+"""
+import importlib
+import logging
+import os
+import sys
+import threading
+import time
+from functools import lru_cache
+
+logger = logging.getLogger("seo_studio")
+
+# Seconds spent on the first import of each lazily loaded module
+import_timings = {}
+
+_nltk_lock = threading.Lock()
+_nltk_checked = {}
+
+# Used when the NLTK stopwords corpus is unavailable (e.g. offline without bundled data)
+FALLBACK_STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because been before being below between
+both but by can could did do does doing down during each few for from further had has have having he her
+here hers herself him himself his how i if in into is it its itself just me more most my myself no nor not
+now of off on once only or other our ours ourselves out over own same she should so some such than that the
+their theirs them themselves then there these they this those through to too under until up very was we
+were what when where which while who whom why will with would you your yours yourself yourselves
+""".split())
+
+
+def offline():
+    return os.environ.get("SEO_OFFLINE", "").lower() in ("1", "true", "yes")
+
+
+def lazy_import(name):
+    """Import ``name`` on first use and record how long the import took."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    import_timings.setdefault(name, time.perf_counter() - start)
+    logger.debug("imported %s in %.1f ms", name, import_timings[name] * 1000)
+    return module
+
+
+def ensure_nltk_data(resource, package=None):
+    """Make sure the NLTK ``resource`` (e.g. ``corpora/stopwords``) is available.
+
+    Checked once per process; downloads only when not in offline mode. Returns
+    whether the resource can be loaded.
+    """
+    if resource in _nltk_checked:
+        return _nltk_checked[resource]
+    with _nltk_lock:
+        if resource in _nltk_checked:
+            return _nltk_checked[resource]
+        nltk = lazy_import("nltk")
+        local_path = os.environ.get("SEO_NLTK_DATA")
+        if local_path and local_path not in nltk.data.path:
+            nltk.data.path.insert(0, local_path)
+        try:
+            nltk.data.find(resource)
+            found = True
+        except LookupError:
+            found = False
+            if not offline():
+                found = nltk.download(package or resource.rsplit("/", 1)[-1], quiet=True)
+        if not found:
+            logger.warning("NLTK resource %s unavailable", resource)
+        _nltk_checked[resource] = bool(found)
+        return _nltk_checked[resource]
+
+
+@lru_cache(maxsize=8)
+def stopword_set(language="english"):
+    """Return the stopword set for ``language``, loaded once per process."""
+    if ensure_nltk_data("corpora/stopwords"):
+        try:
+            return frozenset(lazy_import("nltk.corpus").stopwords.words(language))
+        except (LookupError, OSError):
+            pass
+    return FALLBACK_STOPWORDS
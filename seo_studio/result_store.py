@@ -0,0 +1,123 @@
+"""Persistent store of generated drafts and their analysis.
+
+Results are kept as compressed JSON in a local SQLite file with a TTL and
+entry-count / byte-size eviction, so later interactions and later sessions can
+reopen a draft without regenerating or re-analyzing it.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    keyword TEXT NOT NULL,
+    title TEXT,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+DEFAULT_PATH = os.path.join(".seo_cache", "results.db")
+
+
+def result_key(*parts):
+    """Return the store key for a draft identified by ``parts`` (keyword, title, ...)."""
+    return hashlib.sha256("\x1f".join(str(p) for p in parts).encode("utf-8")).hexdigest()[:32]
+
+
+def content_hash(content):
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ResultStore:
+    def __init__(self, path=DEFAULT_PATH, ttl=7 * 24 * 3600, max_entries=500, max_bytes=64 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = self._connection()
+        conn.executescript(SCHEMA)
+        conn.commit()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def put(self, key, record):
+        """Store ``record`` (a JSON-serializable dict with at least ``keyword``) under ``key``."""
+        payload = zlib.compress(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT INTO results (key, keyword, title, created, accessed, size, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                "accessed=excluded.accessed, size=excluded.size, payload=excluded.payload",
+                (key, record["keyword"], record.get("title"), now, now, len(payload), payload))
+            self._evict(conn, now)
+
+    def get(self, key):
+        """Return the stored record for ``key``, or ``None`` if missing or expired."""
+        conn = self._connection()
+        row = conn.execute("SELECT created, payload FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        created, payload = row
+        now = time.time()
+        with conn:
+            if self.ttl and created < now - self.ttl:
+                conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+        return json.loads(zlib.decompress(payload))
+
+    def recent(self, limit=20):
+        """Return ``(key, keyword, title, created)`` for the most recently used drafts."""
+        cutoff = time.time() - self.ttl if self.ttl else 0
+        return self._connection().execute(
+            "SELECT key, keyword, title, created FROM results WHERE created >= ? "
+            "ORDER BY accessed DESC LIMIT ?", (cutoff, limit)).fetchall()
+
+    def _evict(self, conn, now):
+        if self.ttl:
+            conn.execute("DELETE FROM results WHERE created < ?", (now - self.ttl,))
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        # Drop least recently used entries until both limits hold
+        for key, size in conn.execute("SELECT key, size FROM results ORDER BY accessed").fetchall():
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            count -= 1
+            total -= size
+
+
+_default_store = None
+_default_lock = threading.Lock()
+
+
+def default_result_store():
+    """Return the process-wide store at ``SEO_RESULT_DB`` (default ``.seo_cache/results.db``)."""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = ResultStore(os.environ.get("SEO_RESULT_DB") or DEFAULT_PATH)
+        return _default_store
@@ -0,0 +1,205 @@
+"""SEO scoring against the sidebar targets, vectorized over many drafts or titles.
+
+A draft is scored from 0 to 100 on five criteria, combined with
+:data:`WEIGHTS`:
+
+- ``word_count``: closeness to the target length
+- ``keyword_coverage``: the primary keyword plus up to the target number of related terms
+- ``headings``: a title, enough subheadings for the length, the primary keyword in one of them
+- ``readability``: Flesch reading ease within the target band
+- ``density``: primary keyword density inside :data:`DENSITY_BAND`, with no stuffing
+
+Each draft is scanned and tokenized once; callers that already have its
+scan and density report pass them in instead. The scoring itself is NumPy
+arithmetic over arrays of measurements, so one call scores and ranks
+hundreds of drafts.
+"""
+import re
+
+import numpy as np
+
+from .density import default_engine
+from .readability import TARGET_TOLERANCE, score_arrays
+from .textscan import scan_text
+
+DEFAULT_TARGETS = {"word_count": 1200, "keywords": 5, "readability": 70}
+
+WEIGHTS = {
+    "word_count": 0.2,
+    "keyword_coverage": 0.25,
+    "headings": 0.15,
+    "readability": 0.2,
+    "density": 0.2,
+}
+CRITERIA = tuple(WEIGHTS)
+CRITERIA_LABELS = {
+    "word_count": "Word count",
+    "keyword_coverage": "Keyword coverage",
+    "headings": "Heading structure",
+    "readability": "Readability",
+    "density": "Keyword density",
+}
+
+# Within this fraction of the target word count scores full marks
+WORD_COUNT_TOLERANCE = 0.1
+# Readability this far outside the tolerance band scores zero
+READABILITY_FALLOFF = 30
+# Primary keyword density (%) that scores full marks; past twice the upper bound scores zero
+DENSITY_BAND = (0.5, 2.5)
+# One subheading expected per this many words (at least MIN_SUBHEADINGS)
+WORDS_PER_HEADING = 300
+MIN_SUBHEADINGS = 3
+
+# Titles of this many characters show in full on results pages
+TITLE_LENGTH = (50, 60)
+TITLE_FALLOFF = 30
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$", re.M)
+
+
+def _band(values, low, high, falloff):
+    """1 inside ``[low, high]``, falling linearly to 0 at ``falloff`` outside it."""
+    distance = np.maximum(low - values, 0) + np.maximum(values - high, 0)
+    return np.clip(1 - distance / falloff, 0, 1)
+
+
+def _per_text(value, n, is_terms=False):
+    """Broadcast one shared primary keyword or related list to ``n`` texts (``None`` means none)."""
+    if value is None:
+        return [() if is_terms else None] * n
+    shared = isinstance(value, str) if not is_terms else (not value or isinstance(value[0], str))
+    return [value] * n if shared else list(value)
+
+
+def measure_drafts(texts, primary, related=(), engine=None, stats=None, densities=None):
+    """Scan ``texts`` once each; return the measurements scoring needs as arrays.
+
+    ``primary`` and ``related`` are shared by all texts, or given per text (a
+    list of keywords and a list of term lists). ``stats`` (from
+    :func:`textscan.scan_text` or an ``IncrementalAnalyzer``) and
+    ``densities`` (density reports for the same targets), one per text, are
+    used instead of scanning and tokenizing the texts again.
+    """
+    n = len(texts)
+    primaries = _per_text(primary, n)
+    related_lists = _per_text(related, n, is_terms=True)
+    totals = np.zeros((n, 4), dtype=np.int64)
+    columns = {name: np.zeros(n, dtype=np.int64) for name in
+               ("tokens", "primary_count", "related_found", "related_total",
+                "titles", "subheadings", "primary_in_heading")}
+    for i, text in enumerate(texts):
+        scan = scan_text(text) if stats is None else stats[i]
+        totals[i] = scan["words"], scan["sentences"], scan["syllables"], scan["polysyllables"]
+        keyword = (primaries[i] or "").lower()
+        terms = [term for term in related_lists[i] if term.lower() != keyword]
+        if densities is None:
+            engine = engine or default_engine()
+            ids, vocab = engine.token_ids(text)
+            columns["tokens"][i] = engine.word_count(ids)
+            found = {term.lower(): count for term, count in
+                     engine.target_counts(ids, vocab, ([keyword] if keyword else []) + terms).items()}
+        else:
+            columns["tokens"][i] = densities[i]["total_words"]
+            found = {term.lower(): count for term, count, _ in densities[i]["coverage"]}
+        columns["primary_count"][i] = found[keyword] if keyword else 0
+        columns["related_found"][i] = sum(1 for term in terms if found[term.lower()])
+        columns["related_total"][i] = len(terms)
+        headings = HEADING_RE.findall(text)
+        columns["titles"][i] = sum(1 for marks, _ in headings if len(marks) == 1)
+        columns["subheadings"][i] = len(headings) - columns["titles"][i]
+        columns["primary_in_heading"][i] = bool(keyword) and any(keyword in h.lower() for _, h in headings)
+    columns["words"] = totals[:, 0]
+    columns["readability"] = score_arrays(*totals.T)["flesch_reading_ease"]
+    return columns
+
+
+def score_measurements(m, targets=None):
+    """Score arrays of measurements from :func:`measure_drafts`; return a dict of arrays (0-100)."""
+    targets = dict(DEFAULT_TARGETS, **(targets or {}))
+    words = m["words"].astype(np.float64)
+    target_words = max(targets["word_count"], 1)
+    # Zero at no words or twice the target
+    word_score = _band(words / target_words, 1 - WORD_COUNT_TOLERANCE, 1 + WORD_COUNT_TOLERANCE,
+                       1 - WORD_COUNT_TOLERANCE)
+
+    # Only the first ``keywords`` related terms are expected; more is not penalized
+    expected = np.minimum(m["related_total"], max(targets["keywords"], 0))
+    related_share = np.where(expected > 0, np.minimum(m["related_found"], expected) / np.maximum(expected, 1), 1.0)
+    coverage_score = 0.5 * (m["primary_count"] > 0) + 0.5 * related_share
+
+    wanted = np.maximum(MIN_SUBHEADINGS, words / WORDS_PER_HEADING)
+    heading_score = (0.6 * np.minimum(m["subheadings"] / wanted, 1) + 0.2 * (m["titles"] == 1)
+                     + 0.2 * (m["primary_in_heading"] > 0))
+
+    target = targets["readability"]
+    readability_score = _band(m["readability"], target - TARGET_TOLERANCE, target + TARGET_TOLERANCE,
+                              READABILITY_FALLOFF)
+
+    # Same definition as the density report: occurrences per token, in percent
+    tokens = m["tokens"].astype(np.float64)
+    density = np.where(tokens > 0, m["primary_count"] / np.maximum(tokens, 1) * 100, 0.0)
+    low, high = DENSITY_BAND
+    density_score = np.where(density < low, density / low, np.clip(1 - (density - high) / high, 0, 1))
+
+    scores = {
+        "word_count": word_score * 100,
+        "keyword_coverage": coverage_score * 100,
+        "headings": heading_score * 100,
+        "readability": readability_score * 100,
+        "density": density_score * 100,
+    }
+    scores["seo_score"] = sum(WEIGHTS[name] * scores[name] for name in CRITERIA)
+    scores["primary_density"] = density
+    return scores
+
+
+def score_drafts(texts, primary, related=(), targets=None, engine=None, stats=None, densities=None):
+    """Score a batch of drafts against ``targets`` (keys as in :data:`DEFAULT_TARGETS`).
+
+    Returns a dict of arrays: one per criterion, ``seo_score`` (their weighted
+    sum) and ``primary_density``.
+    """
+    return score_measurements(measure_drafts(texts, primary, related, engine, stats, densities), targets)
+
+
+def breakdown(scores, index=0):
+    """Return the rounded scores of one draft from :func:`score_drafts` as a plain dict."""
+    return {name: round(float(scores[name][index]), 1) for name in ("seo_score",) + CRITERIA}
+
+
+def measure_draft(text, primary, related=(), engine=None, stats=None, density=None):
+    """Measure one draft; the plain dict can be stored with the draft and rescored later."""
+    measurements = measure_drafts([text], primary, related, engine, None if stats is None else [stats],
+                                  None if density is None else [density])
+    return {name: values[0].item() for name, values in measurements.items()}
+
+
+def score_measurement(measurement, targets=None):
+    """Score one stored :func:`measure_draft` result; return :func:`breakdown`'s dict."""
+    return breakdown(score_measurements({name: np.array([value]) for name, value in measurement.items()}, targets))
+
+
+def score_draft(text, primary, related=(), targets=None, engine=None, stats=None, density=None):
+    """Score one draft; return :func:`breakdown`'s dict."""
+    return score_measurement(measure_draft(text, primary, related, engine, stats, density), targets)
+
+
+def score_titles(titles, primary):
+    """Score title variants for length, keyword presence and keyword position (0-100 arrays)."""
+    keyword = (primary or "").lower()
+    lengths = np.array([len(title) for title in titles], dtype=np.float64)
+    positions = np.array([title.lower().find(keyword) if keyword else -1 for title in titles], dtype=np.float64)
+    found = positions >= 0
+    length_score = _band(lengths, *TITLE_LENGTH, TITLE_FALLOFF)
+    position_score = np.where(found, 1 - positions / np.maximum(lengths, 1), 0.0)
+    return {
+        "length": length_score * 100,
+        "keyword": found * 100.0,
+        "position": position_score * 100,
+        "seo_score": (0.4 * length_score + 0.4 * found + 0.2 * position_score) * 100,
+    }
+
+
+def rank(scores, key="seo_score"):
+    """Indices that order the scored items best first (ties keep their input order)."""
+    return np.argsort(-scores[key], kind="stable")
@@ -0,0 +1,78 @@
+"""Run several dashboard replicas that share their caches, for use behind a load balancer.
+
+Usage::
+
+    python -m seo_studio.serve --replicas 4 --base-port 8501
+
+Replica *n* listens on ``base-port + n``. Unless already set, every replica
+gets the same ``SEO_SHARED_CACHE`` (provider responses), ``SEO_RENDER_CACHE_DIR``
+(word clouds and charts) and ``SEO_RESULT_DB`` (saved drafts) under
+``--cache-dir``, so work done by one replica is reused by the others.
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def replica_env(cache_dir):
+    env = dict(os.environ)
+    env.setdefault("SEO_SHARED_CACHE", os.path.join(cache_dir, "shared.db"))
+    env.setdefault("SEO_RENDER_CACHE_DIR", os.path.join(cache_dir, "renders"))
+    env.setdefault("SEO_RESULT_DB", os.path.join(cache_dir, "results.db"))
+    return env
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run dashboard replicas with shared caches.")
+    parser.add_argument("--replicas", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--base-port", type=int, default=8501)
+    parser.add_argument("--address", default="0.0.0.0")
+    parser.add_argument("--cache-dir", default=".seo_cache", help="where the shared caches live")
+    parser.add_argument("--app", default=APP_PATH, help="Streamlit script to serve")
+    args = parser.parse_args(argv)
+
+    env = replica_env(args.cache_dir)
+    os.makedirs(args.cache_dir, exist_ok=True)
+    processes = []
+    for n in range(args.replicas):
+        port = args.base_port + n
+        processes.append(subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", args.app,
+             "--server.port", str(port), "--server.address", args.address, "--server.headless", "true"],
+            env=env))
+        print(f"replica {n} on http://{args.address}:{port}", file=sys.stderr)
+
+    def stop(*_):
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+
+    stopping = []
+
+    def on_sigterm(*_):
+        stopping.append(True)
+        stop()
+
+    signal.signal(signal.SIGTERM, on_sigterm)
+    crashed = False
+    try:
+        while all(process.poll() is None for process in processes):
+            time.sleep(1)
+        # Unless we are shutting down, one replica exited on its own: take the rest down too
+        crashed = not stopping
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop()
+        for process in processes:
+            process.wait()
+    return 1 if crashed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""Cross-process cache for computed results, in a local SQLite file.
+
+Several app replicas (or batch workers) pointed at the same ``SEO_SHARED_CACHE``
+file reuse each other's results, such as provider keyword data, instead of
+each warming up from scratch. Values are compressed JSON with a per-entry TTL.
+Once the file grows past ``max_bytes``, the least recently written entries
+are dropped.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    expires REAL NOT NULL,
+    written REAL NOT NULL,
+    size INTEGER NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cache_written ON cache (written);
+"""
+
+# Check the size limit every this many writes rather than on each one
+EVICT_EVERY = 100
+
+
+class SharedCache:
+    def __init__(self, path, ttl=24 * 3600, max_bytes=256 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = self._connection()
+        conn.executescript(SCHEMA)
+        conn.commit()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, namespace, key):
+        """Return the cached value, or ``None`` if missing or expired."""
+        row = self._connection().execute(
+            "SELECT payload FROM cache WHERE namespace = ? AND key = ? AND expires > ?",
+            (namespace, key, time.time())).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, namespace, key, value, ttl=None):
+        """Store JSON-serializable ``value`` for ``ttl`` seconds (default: the cache TTL)."""
+        payload = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, expires, written, size, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, now + (ttl or self.ttl), now, len(payload), payload))
+            self._writes += 1
+            if self._writes % EVICT_EVERY == 0:
+                self._evict(conn, now)
+
+    def get_many(self, namespace, keys):
+        """Return ``{key: value}`` for the cached, unexpired ``keys``."""
+        keys = list(keys)
+        found = {}
+        conn = self._connection()
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = conn.execute(
+                f"SELECT key, payload FROM cache WHERE namespace = ? AND expires > ? "
+                f"AND key IN ({','.join('?' * len(chunk))})",
+                [namespace, time.time(), *chunk]).fetchall()
+            found.update((key, json.loads(zlib.decompress(payload))) for key, payload in rows)
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, namespace, items, ttl=None):
+        """Store every ``(key, value)`` pair in ``items`` in one transaction."""
+        now = time.time()
+        rows = []
+        for key, value in items:
+            payload = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+            rows.append((namespace, key, now + (ttl or self.ttl), now, len(payload), payload))
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache (namespace, key, expires, written, size, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows)
+            before = self._writes
+            self._writes += len(rows)
+            if self._writes // EVICT_EVERY != before // EVICT_EVERY:
+                self._evict(conn, now)
+
+    def get_or_compute(self, namespace, key, compute, ttl=None):
+        """Return the cached value, calling ``compute()`` and storing its result on a miss."""
+        value = self.get(namespace, key)
+        if value is None:
+            value = compute()
+            if value is not None:
+                self.put(namespace, key, value, ttl)
+        return value
+
+    def _evict(self, conn, now):
+        conn.execute("DELETE FROM cache WHERE expires <= ?", (now,))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for namespace, key, size in conn.execute(
+                "SELECT namespace, key, size FROM cache ORDER BY written").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (namespace, key))
+            total -= size
+
+    def clear(self, namespace=None):
+        conn = self._connection()
+        with conn:
+            if namespace is None:
+                conn.execute("DELETE FROM cache")
+            else:
+                conn.execute("DELETE FROM cache WHERE namespace = ?", (namespace,))
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def default_shared_cache():
+    """Return the cache at ``SEO_SHARED_CACHE``, or ``None`` when it is unset."""
+    global _default_cache
+    path = os.environ.get("SEO_SHARED_CACHE")
+    if not path:
+        return None
+    with _default_lock:
+        if _default_cache is None or _default_cache.path != path:
+            _default_cache = SharedCache(path)
+        return _default_cache
@@ -0,0 +1,117 @@
+"""Local stand-in for a keyword-data API, for offline development and load tests.
+
+Usage::
+
+    python -m seo_studio.stub_server --port 8765 --latency 0.05
+    SEO_PROVIDER_URL=http://127.0.0.1:8765/v1 streamlit run app.py
+
+Serves ``POST /v1/keywords`` with ``{"keywords": [...]}`` and answers
+``{"results": {keyword: data}}`` from the same index / sample / mock data as
+the dashboard. ``--latency`` and ``--error-rate`` simulate a slow or flaky
+provider (errors are 503s with ``Retry-After``).
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .keywords import get_keyword_data
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/health"):
+            self._send(200, {"status": "ok", "requests": self.server.requests})
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if not self.path.rstrip("/").endswith("/keywords"):
+            self._send(404, {"error": "not found"})
+            return
+        server = self.server
+        with server.lock:
+            server.requests += 1
+        if server.latency:
+            time.sleep(server.latency)
+        if server.error_rate and random.random() < server.error_rate:
+            self._send(503, {"error": "unavailable"}, {"Retry-After": "0.05"})
+            return
+        try:
+            keywords = json.loads(body)["keywords"]
+        except (ValueError, KeyError, TypeError):
+            self._send(400, {"error": "expected {\"keywords\": [...]}"})
+            return
+        if len(keywords) > server.max_batch:
+            self._send(413, {"error": f"at most {server.max_batch} keywords per request"})
+            return
+        results = {}
+        for kw in keywords:
+            data = dict(get_keyword_data(kw))
+            data["related"] = list(data["related"])
+            results[kw] = data
+        self._send(200, {"results": results})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host="127.0.0.1", port=8765, latency=0.0, error_rate=0.0, max_batch=100, verbose=False):
+    """Return a stub server bound to ``host:port`` (``port=0`` picks a free port)."""
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.error_rate = error_rate
+    server.max_batch = max_batch
+    server.verbose = verbose
+    server.requests = 0
+    server.lock = threading.Lock()
+    return server
+
+
+def start_stub_server(**kwargs):
+    """Serve on a background thread; return ``(server, base_url)``. Stop with ``server.shutdown()``."""
+    server = make_server(**kwargs)
+    threading.Thread(target=server.serve_forever, name="seo-stub-server", daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}/v1"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve mock keyword data over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--max-batch", type=int, default=100, help="largest accepted batch")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port, args.latency, args.error_rate, args.max_batch, args.verbose)
+    print(f"Serving keyword data on http://{args.host}:{server.server_address[1]}/v1", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""Precompiled title and content templates for each blog type.
+
+Templates are parsed once at import, and a post is assembled from per-section
+parts with ``"".join`` instead of re-formatting f-string lists and growing a
+string with ``+=``.
+"""
+import random
+from string import Formatter
+
+DEFAULT_BLOG_TYPE = "Ultimate Guide"
+
+_formatter = Formatter()
+
+
+def compile_template(template):
+    """Translate a ``{field}`` template into a ``%(field)s`` string for :func:`render`.
+
+    %-formatting against a dict runs in C, so rendering costs about the same as
+    an f-string while the template itself is parsed only once.
+    """
+    parts = []
+    for literal, field, _, _ in _formatter.parse(template):
+        parts.append(literal.replace("%", "%%"))
+        if field:
+            parts.append(f"%({field})s")
+    return "".join(parts)
+
+
+def render(compiled, context):
+    return compiled % context
+
+
+def template_context(keyword):
+    return {
+        "keyword": keyword,
+        "keyword_lower": keyword.lower(),
+        "keyword_title": keyword.title(),
+    }
+
+
+SENTENCES = (
+    "This section explores the important aspects of {keyword_lower} and how it impacts modern strategies.",
+    "Understanding these concepts will help you implement more effective {keyword_lower} techniques.",
+    "Research shows that businesses adopting these methods see significant improvements in their results.",
+    "Let's dive deeper into the practical applications of {keyword_lower} with real-world examples.",
+    "These insights are based on current industry trends and successful case studies."
+)
+
+BULLET_POINTS = (
+    "Important aspect of {keyword_lower}",
+    "Practical implementation tips",
+    "Industry best practices",
+    "Common pitfalls to avoid",
+    "Tools and resources"
+)
+
+BLOG_TEMPLATES = {
+    "How-to Guide": {
+        "titles": (
+            "How to Master {keyword_title}: A Beginner's Guide",
+            "How to Get Started With {keyword_title} in 7 Simple Steps",
+            "How to Improve Your {keyword_title} Results Fast",
+            "How to Avoid the Most Common {keyword_title} Mistakes",
+            "A Step-by-Step Guide to {keyword_title}"
+        ),
+        "sections": (
+            "## What Is {keyword}?",
+            "### Why Learn {keyword} Now",
+            "## What You'll Need",
+            "## Step 1: Set Up Your {keyword} Foundation",
+            "## Step 2: Build Your First {keyword} Workflow",
+            "## Step 3: Measure and Improve",
+            "### Troubleshooting Common Problems",
+            "## Conclusion and Next Steps"
+        ),
+        "sentences": SENTENCES + (
+            "Follow each step in order and check your progress before moving on.",
+        ),
+        "bullet_heading": "**Quick Checklist:**",
+    },
+    "Listicle": {
+        "titles": (
+            "10 Proven {keyword_title} Strategies That Actually Work",
+            "7 {keyword_title} Tips Every Beginner Should Know",
+            "15 {keyword_title} Ideas to Try This Year",
+            "5 {keyword_title} Mistakes You're Probably Making",
+            "The 12 Best {keyword_title} Tools Right Now"
+        ),
+        "sections": (
+            "## Why These {keyword} Tips Matter",
+            "## 1. Start With Clear Goals",
+            "## 2. Learn From the Experts",
+            "## 3. Use the Right Tools",
+            "## 4. Track Your Results",
+            "## 5. Avoid Common Mistakes",
+            "## 6. Keep Up With Trends",
+            "## Final Thoughts"
+        ),
+    },
+    "Case Study": {
+        "titles": (
+            "Case Study: How One Team Transformed Their {keyword_title}",
+            "{keyword_title} Case Study: From Zero to Results in 90 Days",
+            "What We Learned From a Year of {keyword_title}",
+            "Inside a Successful {keyword_title} Campaign",
+            "{keyword_title} in Practice: A Real-World Case Study"
+        ),
+        "sections": (
+            "## Executive Summary",
+            "## The Challenge",
+            "## Our {keyword} Approach",
+            "### Strategy",
+            "### Implementation",
+            "## Results",
+            "## Key Lessons",
+            "## How to Apply This to Your {keyword}"
+        ),
+        "sentences": SENTENCES + (
+            "The team tracked every change so the impact could be measured clearly.",
+        ),
+        "bullet_heading": "**Key Results:**",
+    },
+    "Ultimate Guide": {
+        "titles": (
+            "The Ultimate Guide to {keyword_title} in 2024",
+            "10 Proven {keyword_title} Strategies That Actually Work",
+            "How to Master {keyword_title}: A Beginner's Guide",
+            "The Future of {keyword_title}: Trends and Predictions",
+            "{keyword_title} Explained: Everything You Need to Know"
+        ),
+        "sections": (
+            "## Introduction to {keyword}",
+            "### Why {keyword} Matters Today",
+            "### Key Benefits of Effective {keyword}",
+            "## Getting Started",
+            "### Essential Tools and Resources",
+            "### Common Mistakes to Avoid",
+            "## Advanced {keyword} Strategies",
+            "## Case Studies and Examples",
+            "## Future Trends and Predictions",
+            "## Conclusion and Next Steps"
+        ),
+    },
+    "Comparison": {
+        "titles": (
+            "{keyword_title} Compared: Which Option Is Best?",
+            "The Best {keyword_title} Options Side by Side",
+            "{keyword_title} Showdown: Pros, Cons and Pricing",
+            "Choosing the Right {keyword_title}: A Comparison",
+            "{keyword_title} Alternatives Worth Considering"
+        ),
+        "sections": (
+            "## {keyword}: An Overview",
+            "## How We Compared the Options",
+            "### Features",
+            "### Pricing",
+            "### Ease of Use",
+            "## Pros and Cons",
+            "## Which {keyword} Option Is Right for You?",
+            "## Verdict"
+        ),
+        "bullet_heading": "**At a Glance:**",
+    },
+    "News Article": {
+        "titles": (
+            "{keyword_title}: What Changed This Week",
+            "Breaking: New Developments in {keyword_title}",
+            "{keyword_title} News: What It Means for You",
+            "The Latest {keyword_title} Updates Explained",
+            "Industry Reacts to Major {keyword_title} Shift"
+        ),
+        "sections": (
+            "## What Happened",
+            "## Why It Matters for {keyword}",
+            "## Industry Reactions",
+            "## What Experts Are Saying",
+            "## What This Means for You",
+            "## What's Next"
+        ),
+        "bullet_heading": "**Key Points:**",
+    },
+}
+
+
+class BlogTemplate:
+    """A blog type's title, section, sentence and bullet templates, precompiled."""
+
+    def __init__(self, titles, sections, sentences=SENTENCES, bullet_points=BULLET_POINTS,
+                 bullet_heading="**Key Takeaways:**"):
+        self.titles = tuple(compile_template(t) for t in titles)
+        self.sections = tuple(compile_template(s) for s in sections)
+        self.sentences = tuple(compile_template(s) for s in sentences)
+        self.bullet_points = tuple(compile_template(b) for b in bullet_points)
+        self.bullet_heading = bullet_heading + "\n\n"
+
+    def title_templates(self, keyword):
+        context = template_context(keyword)
+        return [render(t, context) for t in self.titles]
+
+    def outline(self, keyword):
+        context = template_context(keyword)
+        return [render(s, context) for s in self.sections]
+
+    def iter_sections(self, keyword, title, rng=random, sections=None):
+        """Yield the post piece by piece: the title line, then one chunk per section."""
+        context = template_context(keyword)
+        if sections is None:
+            sections = self.outline(keyword)
+        # Rendered once per post instead of once per section
+        sentences = [render(s, context) for s in self.sentences]
+        bullet_points = [render(b, context) for b in self.bullet_points]
+
+        yield f"# {title}\n\n"
+        for section in sections:
+            parts = [section, "\n\n", " ".join(rng.sample(sentences, 3)), "\n\n"]
+            # Add bullet points randomly
+            if rng.random() > 0.5:
+                parts.append(self.bullet_heading)
+                parts.extend([f"- {point}\n" for point in rng.sample(bullet_points, 3)])
+                parts.append("\n")
+            yield "".join(parts)
+
+
+TEMPLATES = {name: BlogTemplate(**spec) for name, spec in BLOG_TEMPLATES.items()}
+BLOG_TYPES = list(TEMPLATES)
+
+
+def get_template(blog_type=None):
+    """Return the compiled template for ``blog_type`` (the Ultimate Guide by default)."""
+    return TEMPLATES.get(blog_type or DEFAULT_BLOG_TYPE, TEMPLATES[DEFAULT_BLOG_TYPE])
+
+
+def title_templates(keyword, blog_type=None):
+    """Return the title suggestions offered for ``keyword``."""
+    return get_template(blog_type).title_templates(keyword)
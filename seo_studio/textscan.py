@@ -0,0 +1,124 @@
+"""Single-pass text scanner: words, sentences, paragraphs, syllables and term counts.
+
+One regex walk over the text produces everything the SEO analysis needs, and
+:class:`TextScanner` accepts the text in chunks so long drafts or whole corpora
+can be analyzed as a stream.
+"""
+import re
+from collections import Counter
+
+from .readability import syllable_totals
+
+# A word, a run of sentence terminators, or a blank line (paragraph break)
+TOKEN_RE = re.compile(r"(\w+)|([.!?]+)|(\n[ \t]*\n\s*)")
+
+
+def _char_class(char):
+    if char.isalnum() or char == "_":
+        return "w"
+    if char in ".!?":
+        return "t"
+    if char.isspace():
+        return "s"
+    return None
+
+
+class TextScanner:
+    """Accumulate text statistics over a stream of chunks.
+
+    Call :meth:`feed` with each chunk and :meth:`close` once at the end; a token
+    split across two chunks is held back until the next chunk completes it.
+    """
+
+    def __init__(self):
+        self.words = 0
+        self.sentences = 0
+        self.paragraphs = 0
+        self.terms = Counter()
+        self._carry = ""
+        self._sentence_words = 0
+        self._paragraph_words = 0
+
+    def feed(self, chunk):
+        text = self._carry + chunk
+        if not text:
+            return
+        cut = len(text)
+        klass = _char_class(text[-1])
+        if klass is not None:
+            while cut > 0 and _char_class(text[cut - 1]) == klass:
+                cut -= 1
+        self._scan(text[:cut])
+        self._carry = text[cut:]
+
+    def _scan(self, text):
+        words = []
+        append = words.append
+        sentence_words = self._sentence_words
+        paragraph_words = self._paragraph_words
+        for match in TOKEN_RE.finditer(text.lower()):
+            kind = match.lastindex
+            if kind == 1:
+                append(match.group(1))
+                sentence_words += 1
+                paragraph_words += 1
+            elif kind == 2:
+                if sentence_words:
+                    self.sentences += 1
+                    sentence_words = 0
+            else:
+                # A blank line ends any open sentence (e.g. headings) and the paragraph
+                if sentence_words:
+                    self.sentences += 1
+                    sentence_words = 0
+                if paragraph_words:
+                    self.paragraphs += 1
+                    paragraph_words = 0
+        self._sentence_words = sentence_words
+        self._paragraph_words = paragraph_words
+        self.words += len(words)
+        # Counter.update on a list counts in C, much faster than per-token increments
+        self.terms.update(words)
+
+    def close(self):
+        """Flush the remaining text and return the statistics dict."""
+        self._scan(self._carry)
+        self._carry = ""
+        if self._sentence_words:
+            self.sentences += 1
+            self._sentence_words = 0
+        if self._paragraph_words:
+            self.paragraphs += 1
+            self._paragraph_words = 0
+        return self.stats()
+
+    def stats(self):
+        # Syllables are counted per distinct term, not per occurrence
+        syllables, polysyllables = syllable_totals(self.terms)
+        return {
+            "words": self.words,
+            "sentences": self.sentences,
+            "paragraphs": self.paragraphs,
+            "syllables": syllables,
+            "polysyllables": polysyllables,
+            "terms": self.terms,
+        }
+
+
+CHUNK_SIZE = 65536
+
+
+def scan_text(text):
+    """Return the statistics for a complete ``text``."""
+    scanner = TextScanner()
+    for start in range(0, len(text), CHUNK_SIZE):
+        scanner.feed(text[start:start + CHUNK_SIZE])
+    return scanner.close()
+
+
+def scan_chunks(chunks):
+    """Return the statistics for text arriving as an iterable of ``chunks``."""
+    scanner = TextScanner()
+    for chunk in chunks:
+        scanner.feed(chunk)
+    return scanner.close()